@@ -0,0 +1,110 @@
+"""Fit circular arcs to runs of sampled profile points.
+
+Used by the posts to replace dense ``G1`` chords with ``G2``/``G3`` blocks.
+Every arc passes exactly through the first and last point of its run (the
+controller checks start/end radius agreement), so the circle is the one
+through the run's first, middle and last point; the run is accepted when
+every point in it lies within *tol* of that circle.
+"""
+
+from __future__ import annotations
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class Arc(NamedTuple):
+    """Points ``i0..i1`` (inclusive) lie on the circle centred at (cx, cy)."""
+    i0: int
+    i1: int
+    cx: float
+    cy: float
+    ccw: bool
+
+
+def _circle(p0, p1, p2) -> Optional[Tuple[float, float, float]]:
+    """``(cx, cy, r)`` through three points, ``None`` when they are colinear."""
+    (ax, ay), (bx, by), (cx, cy) = p0, p1, p2
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return None
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    return ux, uy, float(np.hypot(ax - ux, ay - uy))
+
+
+def _fit(pts: np.ndarray, i0: int, i1: int, tol: float) -> Optional[Arc]:
+    """The arc through ``pts[i0..i1]``, or ``None`` if the run is not one."""
+    c = _circle(pts[i0], pts[(i0 + i1) // 2], pts[i1])
+    if c is None:
+        return None
+    cx, cy, r = c
+    run = pts[i0:i1 + 1]
+    dx, dy = run[:, 0] - cx, run[:, 1] - cy
+    if np.abs(np.hypot(dx, dy) - r).max() > tol:
+        return None
+
+    # the arc must also stay near each chord it replaces (the colinear
+    # filter leaves long ones), and sweep one way round, under a full turn
+    half = 0.5 * np.hypot(np.diff(run[:, 0]), np.diff(run[:, 1])).max()
+    if half >= r or r - np.sqrt(r * r - half * half) > tol:
+        return None
+
+    cross = dx[:-1] * dy[1:] - dy[:-1] * dx[1:]
+    dot = dx[:-1] * dx[1:] + dy[:-1] * dy[1:]
+    if not ((cross > 0).all() or (cross < 0).all()):
+        return None
+    if np.abs(np.arctan2(cross, dot)).sum() >= 2 * np.pi - 1e-6:
+        return None
+
+    # an arc that is indistinguishable from its chord gains nothing
+    half = 0.5 * float(np.hypot(*(run[-1] - run[0])))
+    if r - np.sqrt(max(r * r - half * half, 0.0)) <= tol:
+        return None
+    return Arc(i0, i1, cx, cy, bool(cross[0] > 0))
+
+
+def fit_arcs(pts, tol: float, *, min_points: int = 4) -> List[Arc]:
+    """Greedy left-to-right arc fit over the ``(N, 2)`` points *pts*.
+
+    Each arc is grown from its start by doubling, then trimmed back by
+    bisection to the longest run that still fits. Runs shorter than
+    *min_points* stay as line segments. Consecutive arcs share an endpoint.
+    """
+    pts = np.asarray(pts, dtype=float).reshape(-1, 2)
+    n = len(pts)
+    arcs: List[Arc] = []
+    i = 0
+    while i + min_points <= n:
+        j = i + min_points - 1
+        best = _fit(pts, i, j, tol)
+        if best is None:
+            i += 1
+            continue
+
+        # double the run while it fits, then bisect between good and bad
+        good, step = j, min_points
+        while good + step < n:
+            a = _fit(pts, i, good + step, tol)
+            if a is None:
+                break
+            good, best, step = good + step, a, step * 2
+        bad = min(good + step, n)
+        while bad - good > 1:
+            mid = (good + bad) // 2
+            a = _fit(pts, i, mid, tol)
+            if a is None:
+                bad = mid
+            else:
+                good, best = mid, a
+
+        arcs.append(best)
+        i = best.i1
+    return arcs
+
+
+def reverse_arcs(arcs: List[Arc], n: int) -> List[Arc]:
+    """*arcs* re-indexed for the same *n* points walked backwards."""
+    return [Arc(n - 1 - a.i1, n - 1 - a.i0, a.cx, a.cy, not a.ccw)
+            for a in reversed(arcs)]
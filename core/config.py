@@ -1,5 +1,9 @@
 # config.py
+from __future__ import annotations
 import json
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 CONFIG_FILE = Path(__file__).parent / "config.json"
@@ -31,11 +35,44 @@ _defaults = {
     }
 }
 
-if not CONFIG_FILE.exists():
-    CONFIG_FILE.write_text(json.dumps(_defaults, indent=4))
-    config = _defaults.copy()
-else:
-    config = json.loads(CONFIG_FILE.read_text())
+# bytes of config.json as last read or written; saves compare against this
+_last_serialized: bytes | None = None
+
+
+@lru_cache(maxsize=None)
+def load_config() -> dict:
+    """Parse config.json once per process (writing the defaults if missing)."""
+    global _last_serialized
+    if not CONFIG_FILE.exists():
+        cfg = json.loads(json.dumps(_defaults))
+        _write(json.dumps(cfg, indent=4).encode("utf-8"))
+        return cfg
+    _last_serialized = CONFIG_FILE.read_bytes()
+    return json.loads(_last_serialized)
+
+
+def __getattr__(name):
+    # ``from core.config import config`` loads the file on first use
+    if name == "config":
+        return load_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _write(data: bytes) -> None:
+    """Replace config.json atomically so a crash never leaves half a file."""
+    global _last_serialized
+    with tempfile.NamedTemporaryFile(dir=CONFIG_FILE.parent, prefix=".config-",
+                                     suffix=".tmp", delete=False) as fh:
+        fh.write(data)
+    try:
+        os.replace(fh.name, CONFIG_FILE)
+    except BaseException:
+        os.unlink(fh.name)
+        raise
+    _last_serialized = data
+
 
 def save_config():
-    CONFIG_FILE.write_text(json.dumps(config, indent=4))
+    data = json.dumps(load_config(), indent=4).encode("utf-8")
+    if data != _last_serialized:                # unchanged: no disk I/O at all
+        _write(data)
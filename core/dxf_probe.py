@@ -3,20 +3,42 @@
 import math
 from typing import Iterable, Optional, Sequence
 
+import numpy as np
 import ezdxf
-from ezdxf.entities import Line, Circle, Arc, LWPolyline
-
-
-def _angle_deg(dx: float, dy: float) -> float:
-
-    return math.degrees(math.atan2(dy, dx)) % 360.0
-
-def _on_arc_ccw(a: float, start: float, end: float) -> bool:
-    a, start, end = a % 360, start % 360, end % 360
-    return start <= a <= end if start <= end else (a >= start or a <= end)
-
-def _on_arc(a: float, start: float, end: float, ccw: bool) -> bool:
-    return _on_arc_ccw(a, start, end) if ccw else _on_arc_ccw(a, end, start)
+from ezdxf.entities import Line, Circle, Arc
+
+from core.probe_kernels import highest_y_kernel
+
+# arc spans are widened by this much (degrees) at both ends so hits exactly
+# on an endpoint, where the profile joins the next entity, survive rounding
+_SPAN_EPS = 1e-9
+
+def _on_arc(px, py, cs, ss, ce, se, big):
+    """Is the direction (px, py) inside the CCW sweep from (cs, ss) to (ce, se)?
+
+    Two cross products replace the atan2: "left of start" and "right of
+    end". A sweep over 180° needs only one of them to hold, a smaller one
+    both.
+    """
+    after_start = cs * py - ss * px >= 0.0
+    before_end = px * se - py * ce >= 0.0
+    return (after_start or before_end) if big else (after_start and before_end)
+
+def _arc_params(a: Arc):
+    """``(cx, cy, r, cos_s, sin_s, cos_e, sin_e, big)`` of *a*, swept CCW.
+
+    *big* is 1.0 when the sweep exceeds 180°.
+    """
+    cx, cy, _ = a.dxf.center
+    start, end = a.dxf.start_angle, a.dxf.end_angle
+    ccw = (a.dxf.extrusion[2] if hasattr(a.dxf, "extrusion") else 1.0) >= 0
+    if not ccw:
+        start, end = end, start
+    span = (end % 360.0 - start % 360.0) % 360.0
+    s = math.radians(start - _SPAN_EPS)
+    e = math.radians(start + span + _SPAN_EPS)
+    return (cx, cy, a.dxf.radius, math.cos(s), math.sin(s),
+            math.cos(e), math.sin(e), float(span + 2 * _SPAN_EPS > 180.0))
 
 class VerticalProbe:
 
@@ -30,45 +52,152 @@ class VerticalProbe:
 
     def rebuild(self, source: Iterable):
         self._arcs, self._circs, self._polys, self._lines = [], [], [], []
+        buckets = {
+            "ARC": self._arcs, "CIRCLE": self._circs,
+            "LWPOLYLINE": self._polys, "LINE": self._lines,
+        }
+        buckets = {t: buckets[t] for t in self._types if t in buckets}
+
+        # a layout can filter by type itself; plain iterables are scanned
+        if buckets and hasattr(source, "query"):
+            source = source.query(" ".join(buckets))
         for e in source:
-            t = e.dxftype()
-            if t == "ARC":
-                self._arcs.append(e)
-            elif t == "CIRCLE":
-                self._circs.append(e)
-            elif t == "LWPOLYLINE":
-                self._polys.append(e)
-            elif t == "LINE":
-                self._lines.append(e)
+            bucket = buckets.get(e.dxftype())
+            if bucket is not None:
+                bucket.append(e)
+        self._arc_meta = [_arc_params(a) for a in self._arcs]
+
+        # explode polylines once; queries only ever see their segments
+        self._poly_arcs, self._poly_lines = [], []
+        for p in self._polys:
+            for seg in p.virtual_entities():
+                t = seg.dxftype()
+                if t == "ARC":
+                    self._poly_arcs.append(_arc_params(seg))
+                elif t == "LINE":
+                    self._poly_lines.append(seg)
+        self._build_arrays()
+
+    def _build_arrays(self):
+        """Pack the entity geometry into flat float arrays (one per field)."""
+        lines = self._lines + self._poly_lines
+
+        n = len(self._circs)
+        self._c_cx, self._c_cy, self._c_r = np.empty(n), np.empty(n), np.empty(n)
+        for i, c in enumerate(self._circs):
+            self._c_cx[i], self._c_cy[i], _ = c.dxf.center
+            self._c_r[i] = c.dxf.radius
+
+        n = len(lines)
+        self._l_x1, self._l_y1 = np.empty(n), np.empty(n)
+        self._l_x2, self._l_y2 = np.empty(n), np.empty(n)
+        for i, l in enumerate(lines):
+            self._l_x1[i], self._l_y1[i], _ = l.dxf.start
+            self._l_x2[i], self._l_y2[i], _ = l.dxf.end
+
+        meta = self._arc_meta + self._poly_arcs
+        arr = np.array(meta, dtype=float).reshape(-1, 8).T
+        (self._a_cx, self._a_cy, self._a_r,
+         self._a_cs, self._a_ss, self._a_ce, self._a_se,
+         self._a_big) = (np.ascontiguousarray(c) for c in arr)
+
+        # highest top (cy + r) first: the kernel stops at the first circle /
+        # arc that cannot beat the best y found so far
+        for names in (("_c_cx", "_c_cy", "_c_r"),
+                      ("_a_cx", "_a_cy", "_a_r", "_a_cs", "_a_ss",
+                       "_a_ce", "_a_se", "_a_big")):
+            cols = [getattr(self, k) for k in names]
+            order = np.argsort(-(cols[1] + cols[2]), kind="stable")
+            for k, c in zip(names, cols):
+                setattr(self, k, np.ascontiguousarray(c[order]))
 
     # ---------- public ------------------------------------------------
     def highest_y(self, x: float) -> Optional[float]:
-        for bucket in (
-            self._arcs,
-            self._circs,
-            self._polys,
-            self._lines,
+        """Highest intersection of the vertical at *x* with any entity."""
+        best = None
+        for solve, items in (
+            (self._y_arc, self._arc_meta),
+            (self._y_circle, self._circs),
+            (self._y_arc, self._poly_arcs),
+            (self._y_line, self._poly_lines),
+            (self._y_line, self._lines),
         ):
-            best = None
-            for e in bucket:
-                y = self._y_at_x(e, x)
-                if y is not None:
-                    best = y if best is None else max(best, y)
-            if best is not None:
-                return best
-        return None  # nothing intersects
-
-    # ---------- dispatch ---------------------------------------------
-    def _y_at_x(self, e, x):
-        if isinstance(e, Arc):
-            return self._y_arc(e, x)
-        if isinstance(e, Circle):
-            return self._y_circle(e, x)
-        if isinstance(e, LWPolyline):
-            return self._y_poly(e, x)
-        if isinstance(e, Line):
-            return self._y_line(e, x)
-        return None
+            for e in items:
+                y = solve(e, x)
+                if y is not None and (best is None or y > best):
+                    best = y
+        return best  # None: nothing intersects
+
+    def highest_y_batch(self, xs) -> np.ndarray:
+        """Highest intersection y for every x in *xs* (``NaN`` where nothing hits).
+
+        Same result as :meth:`highest_y`, evaluated column-wise on the packed
+        arrays from :meth:`rebuild`.
+        """
+        xs = np.ascontiguousarray(xs, dtype=float).ravel()
+        if highest_y_kernel is not None:
+            return highest_y_kernel(
+                xs,
+                self._c_cx, self._c_cy, self._c_r,
+                self._l_x1, self._l_y1, self._l_x2, self._l_y2,
+                self._a_cx, self._a_cy, self._a_r,
+                self._a_cs, self._a_ss, self._a_ce, self._a_se, self._a_big,
+            )
+        return self._highest_y_numpy(xs)
+
+    def _highest_y_numpy(self, xs):
+        best = np.maximum.reduce([
+            self._circle_max(xs),
+            self._line_max(xs),
+            self._arc_max(xs),
+        ])
+        best[np.isneginf(best)] = np.nan
+        return best
+
+    # ---------- vectorised solvers (entities × samples) ----------------
+    def _circle_max(self, xs):
+        if not self._c_r.size:
+            return np.full(xs.shape, -np.inf)
+        r = self._c_r[:, None]
+        dx = xs[None, :] - self._c_cx[:, None]
+        y = self._c_cy[:, None] + np.sqrt(np.maximum(r * r - dx * dx, 0.0))
+        return np.where(np.abs(dx) <= r, y, -np.inf).max(axis=0)
+
+    def _line_max(self, xs):
+        if not self._l_x1.size:
+            return np.full(xs.shape, -np.inf)
+        x1, y1 = self._l_x1[:, None], self._l_y1[:, None]
+        x2, y2 = self._l_x2[:, None], self._l_y2[:, None]
+        x = xs[None, :]
+        vert = np.isclose(x1, x2, rtol=1e-9, atol=0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = y1 + (x - x1) / (x2 - x1) * (y2 - y1)
+        hit = ~vert & (x >= np.minimum(x1, x2)) & (x <= np.maximum(x1, x2))
+        y = np.where(hit, y, -np.inf)
+        # vertical lines only register when x lands on them
+        on_vert = vert & np.isclose(x, x1, rtol=1e-9, atol=0.0)
+        y = np.where(on_vert, np.maximum(y1, y2), y)
+        return y.max(axis=0)
+
+    def _arc_max(self, xs):
+        if not self._a_r.size:
+            return np.full(xs.shape, -np.inf)
+        cx, cy, r = self._a_cx[:, None], self._a_cy[:, None], self._a_r[:, None]
+        cs, ss = self._a_cs[:, None], self._a_ss[:, None]
+        ce, se = self._a_ce[:, None], self._a_se[:, None]
+        big = self._a_big[:, None] > 0.0
+
+        dx = xs[None, :] - cx
+        inside = np.abs(dx) <= r
+        dy = np.sqrt(np.maximum(r * r - dx * dx, 0.0))
+
+        best = np.full(dx.shape, -np.inf)
+        for sy in (dy, -dy):
+            after_start = cs * sy - ss * dx >= 0.0
+            before_end = dx * se - sy * ce >= 0.0
+            on = np.where(big, after_start | before_end, after_start & before_end)
+            best = np.where(inside & on, np.maximum(best, cy + sy), best)
+        return best.max(axis=0)
 
     # ---------- per-entity solvers (same maths you had) ---------------
     @staticmethod
@@ -92,29 +221,18 @@ class VerticalProbe:
         t = (x - x1) / (x2 - x1)
         return y1 + t * (y2 - y1)
 
-    def _y_poly(self, p: LWPolyline, x):
-        best = None
-        for seg in p.virtual_entities():
-            y = self._y_at_x(seg, x)
-            if y is not None:
-                best = y if best is None else max(best, y)
-        return best
-
-    def _y_arc(self, a: Arc, x):
-        cx, cy, _ = a.dxf.center
-        r, dx = a.dxf.radius, x - cx
+    @staticmethod
+    def _y_arc(m, x):
+        cx, cy, r, cs, ss, ce, se, big = m
+        dx = x - cx
 
         if abs(dx) > r:
             return None
 
         dy = math.sqrt(r * r - dx * dx)
-        hits = [(x, cy + dy), (x, cy - dy)]
-
-        start, end = a.dxf.start_angle, a.dxf.end_angle
-        ccw = (a.dxf.extrusion[2] if hasattr(a.dxf, "extrusion") else 1.0) >= 0
         ys = [
-            py
-            for px, py in hits
-            if _on_arc(_angle_deg(px - cx, py - cy), start, end, ccw)
+            cy + sy
+            for sy in (dy, -dy)
+            if _on_arc(dx, sy, cs, ss, ce, se, big)
         ]
-        return max(ys) if ys else None
\ No newline at end of file
+        return max(ys) if ys else None
@@ -3,8 +3,6 @@ from pathlib import Path
 from typing import Sequence
 
 from . import planner, probe
-from .post_processors.osai_post import OsaiPost
-from .post_processors.breton_post import BretonPost
 
 
 def generate_path(dxf_wrapper, cfg, label: str) -> probe.Path:
@@ -23,8 +21,17 @@ def generate_path(dxf_wrapper, cfg, label: str) -> probe.Path:
     return path
 
 
-def export_gcode(passes: Sequence[object], cfg, out_file: str | Path) -> Path:
-    """Gather paths in *passes* and write a G-code file to *out_file*."""
+def export_gcode(passes: Sequence[object], cfg, out_file: str | Path,
+                 labels: Sequence[str] | None = None) -> Path:
+    """Gather paths in *passes* and write a G-code file to *out_file*.
+
+    *labels*, parallel to *passes* (``""`` for anything not a path), saves
+    the type check per pass when the caller already keeps them.
+    """
+    # the posts are only needed on export; keep them out of start-up
+    from .post_processors.osai_post import OsaiPost
+    from .post_processors.breton_post import BretonPost
+
     mach = cfg["machine_settings"]
     tool = cfg["tool_settings"]
     tp   = cfg["toolpath_settings"]
@@ -32,13 +39,14 @@ def export_gcode(passes: Sequence[object], cfg, out_file: str | Path) -> Path:
     controller = mach.get("controller", "Osai")
     PostClass  = BretonPost if controller == "Breton" else OsaiPost
 
+    if labels is None:
+        labels = [p.label if isinstance(p, probe.Path) else "" for p in passes]
     rough_pts, smooth_pts = [], None
-    for p in passes:
-        if isinstance(p, probe.Path):
-            if p.label == "roughing":
-                rough_pts.extend(p.points)
-            elif p.label == "smoothing" and smooth_pts is None:
-                smooth_pts = list(p.points)
+    for p, label in zip(passes, labels):
+        if label == "roughing":
+            rough_pts.extend(p.points)
+        elif label == "smoothing" and smooth_pts is None:
+            smooth_pts = p.points                 # the post copies it
 
     if not rough_pts:
         raise ValueError("Need at least one roughing path")
@@ -57,6 +65,7 @@ def export_gcode(passes: Sequence[object], cfg, out_file: str | Path) -> Path:
         cut_feed=tp.get("roughing_feedrate", 2000.0),
         cut_feed_xy=tp.get("smoothing_feedrate", 800.0),
         invert_xy=(mach.get("table_orientation") == "side"),
+        arc_tolerance=tp.get("arc_tolerance"),
     )
 
     out_path = Path(out_file)
@@ -5,11 +5,27 @@ from __future__ import annotations
 from . import probe
 
 
-def _colinear(p0: probe.Point, p1: probe.Point, p2: probe.Point, *, tol: float = 1e-3) -> bool:
-    """Return ``True`` if the three points are approximately colinear."""
-    (x0, y0), (x1, y1), (x2, y2) = p0, p1, p2
-    area = abs((x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0))
-    return area <= tol
+def _drop_colinear(pts: list[probe.Point], *, tol: float = 1e-3) -> list[probe.Point]:
+    """Drop points that are colinear with the last kept point and their successor.
+
+    Three points count as colinear when their cross product is at most *tol*.
+    The test is inlined with the anchor held in locals since it runs once
+    per sample.
+    """
+    if len(pts) < 3:
+        return list(pts)
+
+    keep = [pts[0]]
+    x0, y0 = pts[0]
+    x1, y1 = pts[1]
+    for p2 in pts[2:]:
+        x2, y2 = p2
+        if abs((x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0)) > tol:
+            keep.append((x1, y1))
+            x0, y0 = x1, y1
+        x1, y1 = x2, y2
+    keep.append(pts[-1])
+    return keep
 
 
 def build_roughing_path(dxf_wrapper, cfg) -> probe.Path:
@@ -57,13 +73,7 @@ def build_smoothing_path(dxf_wrapper, cfg) -> probe.Path:
     if stock:
         pts = [(x, y + stock) for x, y in pts]
 
-    if len(pts) >= 3:
-        keep = [pts[0]]
-        for i in range(1, len(pts) - 1):
-            if not _colinear(keep[-1], pts[i], pts[i + 1]):
-                keep.append(pts[i])
-        keep.append(pts[-1])
-        pts = keep
+    pts = _drop_colinear(pts)
 
     return probe.Path(points=pts, label="smoothing")
 
@@ -0,0 +1,280 @@
+# base_post.py
+# ---------------------------------------------------------------------------
+#   _BaseSawPost
+#     ▸ Shared roughing + smoothing generator for the bridge-saw posts
+#     ▸ Subclasses supply the controller dialect: header/footer lines,
+#       comment wording and the output file suffix
+#     ▸ Output is modal – repeated X/Y/Z/F words are left out
+# ---------------------------------------------------------------------------
+
+from __future__ import annotations
+import math
+from pathlib import Path
+from itertools import islice
+from typing import Dict, Iterator, Sequence, Tuple, List, TextIO
+
+import numpy as np
+
+from core.arc_fit import Arc, fit_arcs, reverse_arcs
+
+
+def _xy_pairs(pts) -> List[Tuple[float, float]]:
+    """*pts* as ``(x, y)`` tuples; QPointF and longer rows are coerced."""
+    try:                              # the planner's (x, y) tuples: no checks
+        return [(x, y) for x, y in pts]
+    except (TypeError, ValueError):
+        return [(p.x(), p.y()) if hasattr(p, "x") else (p[0], p[1]) for p in pts]
+
+
+class _BaseSawPost:
+    """Roughing slices in Y plus serpentine X-Z smoothing stripes."""
+
+    file_suffix = ".nc"
+    retract_line = "M18"
+
+    # ------------------------------------------------------------------ #
+    def __init__(
+        self,
+        points: Sequence,
+        smoothing_pts: Sequence | None = None,
+        *,
+        blade_width: float = 3.5,
+        blade_diameter: float | None = None,
+        y_start: float,
+        y_end: float,
+        y_step: float | None = None,
+        z_clear: float,
+        z_max: float,
+        plunge_feed: float = 500.0,
+        cut_feed: float = 2000.0,
+        cut_feed_xy: float | None = None,
+        invert_xy: bool = False,
+        arc_tolerance: float | None = None,
+    ):
+        self.points: List[Tuple[float, float]] = _xy_pairs(points)
+        self.smooth: List[Tuple[float, float]] = _xy_pairs(smoothing_pts or [])
+
+        self.blade_w = blade_width
+        self.blade_d = blade_diameter
+        self.y0, self.y1 = y_start, y_end
+        self.y_step = abs(y_step or blade_width)          # always positive
+        self.z_clear, self.z_max = z_clear, z_max
+
+        self.f_plunge = plunge_feed
+        self.f_cut    = cut_feed
+        self.f_xy     = cut_feed_xy or cut_feed
+
+        self.invert   = invert_xy                         # swap X/Y on output
+        self._yw      = "X" if invert_xy else "Y"         # word for table Y
+        self.arc_tol  = arc_tolerance                     # None: G1 chords only
+        self._last: Dict[str, str] = {}                   # last emitted word values
+
+    # ---------- dialect hooks ----------------------------------------------
+    def header_lines(self) -> List[str]:
+        return []
+
+    def footer_lines(self) -> List[str]:
+        return []
+
+    def smoothing_banner(self) -> List[str]:
+        return []
+
+    def rough_comment(self, idx: int) -> str:
+        return f"; ---- Rough #{idx} ----"
+
+    def stripe_comment(self, y: float, forward: bool) -> str:
+        return f"; ---- stripe Y={y:.2f} ----"
+
+    # ---------- helpers -----------------------------------------------------
+    # X/Y/Z and F are modal: a word whose text matches the last one emitted is
+    # left out, and a block that no longer moves anything is skipped. One
+    # helper per call shape the program uses; each returns () or (line,).
+    def _feed(self, f: float) -> str:
+        s = f"{f:.0f}"
+        if self._last.get("F") == s:
+            return ""
+        self._last["F"] = s
+        return "  F" + s
+
+    def _move_z(self, g: str, z: float, f: float | None = None) -> Tuple[str, ...]:
+        s = f"{z:.2f}"
+        if self._last.get("Z") == s:
+            return ()
+        self._last["Z"] = s
+        return (f"{g}  Z{s}" if f is None else f"{g}  Z{s}{self._feed(f)}",)
+
+    def _move_y(self, g: str, y: float, f: float) -> Tuple[str, ...]:
+        """Table-Y move, posted on the X axis when inverted."""
+        w = self._yw
+        s = f"{y:.2f}"
+        if self._last.get(w) == s:
+            return ()
+        self._last[w] = s
+        return (f"{g}  {w}{s}{self._feed(f)}",)
+
+    def _move_xy(self, g: str, x: float, y: float, tail: str = "") -> Tuple[str, ...]:
+        if self.invert:
+            x, y = y, x                                   # swap
+        last = self._last
+        line = g
+        s = f"{x:.2f}"
+        if last.get("X") != s:
+            last["X"] = s
+            line += "  X" + s
+        s = f"{y:.2f}"
+        if last.get("Y") != s:
+            last["Y"] = s
+            line += "  Y" + s
+        if tail:
+            return (f"{line}  {tail}",)
+        return (line,) if line != g else ()
+
+    def _stripe_ys(self) -> List[float]:
+        """Y of every smoothing stripe, stepping from y0 towards y1 (inclusive)."""
+        step = -self.y_step if self.y0 > self.y1 else self.y_step
+        n = math.floor((self.y1 - self.y0) / step + 1e-9) + 1
+        return (self.y0 + step * np.arange(n)).tolist()
+
+    def _smooth_block(self, pts: np.ndarray, arcs: Sequence[Arc] = ()) -> List[str]:
+        """Lines for one pass over *pts*, entered while sitting on pts[0].
+
+        The X/Z words are the same on every stripe, so they are formatted
+        once, a column at a time, and words repeating the previous point are
+        dropped up front. Each run in *arcs* becomes a single ``G2``/``G3``
+        to its last point. The feed is added by :meth:`_enter_pass`.
+        """
+        xw = "Y" if self.invert else "X"
+        xs = np.char.mod(f"{xw}%.2f", pts[:, 0])
+        zs = np.char.mod("Z%.2f", pts[:, 1])
+        new_x = np.r_[False, xs[1:] != xs[:-1]]
+        new_z = np.r_[False, zs[1:] != zs[:-1]]
+        rows = np.char.add("G1", np.where(new_x, np.char.add("  ", xs), ""))
+        rows = np.char.add(rows, np.where(new_z, np.char.add("  ", zs), ""))
+        keep = new_x | new_z
+        if not arcs:
+            return rows[keep].tolist()
+
+        # G18 (XZ) arcs that are CCW in (x, z) are G2; in G19 (YZ) they are G3
+        rows = rows.astype(object)
+        iw = "J" if self.invert else "I"
+        for a in arcs:
+            g = "G2" if a.ccw != self.invert else "G3"
+            x0, z0 = pts[a.i0]
+            rows[a.i1] = (f"{g}  {xs[a.i1]}  {zs[a.i1]}  "
+                          f"{iw}{a.cx - x0:.3f}  K{a.cy - z0:.3f}")
+            keep[a.i0 + 1:a.i1] = False
+            keep[a.i1] = True
+        return rows[keep].tolist()
+
+    def _enter_pass(self, block: List[str], end: Tuple[float, float]) -> str:
+        """First line of a non-empty *block*, carrying the feed if it changed.
+
+        Also records the modal state the whole block leaves behind (it ends
+        on *end*).
+        """
+        f = f"{self.f_xy:.0f}"
+        head = block[0] if self._last.get("F") == f else f"{block[0]}  F{f}"
+        self._last["F"] = f
+        self._last["Y" if self.invert else "X"] = f"{end[0]:.2f}"
+        self._last["Z"] = f"{end[1]:.2f}"
+        return head
+
+    # ------------------------------------------------------------------ #
+    def generate(self) -> List[str]:
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the program one line at a time (no line terminators)."""
+        return self._program()
+
+    def _program(self, joined: bool = False) -> Iterator[str]:
+        """The program as lines; with *joined*, each smoothing pass after its
+        first line comes as one ``\\n``-joined string (for :meth:`write`)."""
+        self._last = {}
+        yield from self.header_lines()
+
+        c_code = "C0 A0" if self.invert else "C-90 A0"
+
+        # ------------------- roughing ---------------------------------
+        for idx, (x, z) in enumerate(self.points, start=1):
+            yield self.rough_comment(idx)
+            yield from self._move_z("G0", self.z_clear)
+            yield from self._move_xy("G0", x, self.y0, c_code)
+            yield from self._move_z("G1", z, self.f_plunge)
+            yield from self._move_y("G1", self.y1, self.f_cut)
+        yield self.retract_line
+        self._last.pop("Z", None)
+
+        # ------------------- smoothing --------------------------------
+        if self.smooth:
+            yield from self.smoothing_banner()
+
+            ys     = self._stripe_ys()
+            pts    = np.asarray(self.smooth, dtype=float).reshape(-1, 2)
+            arcs   = fit_arcs(pts, self.arc_tol) if self.arc_tol else []
+            fwd    = self._smooth_block(pts, arcs)
+            rev    = self._smooth_block(pts[::-1], reverse_arcs(arcs, len(pts)))
+            if joined:                   # same text every stripe: join once
+                bodies = ["\n".join(islice(b, 1, None)) for b in (fwd, rev)]
+            dir_f  = True                # start left→right
+            first  = True
+            if arcs:                     # arcs lie in the table-X/Z plane
+                yield "G19" if self.invert else "G18"
+
+            for i, y in enumerate(ys):
+                fx, fz = self.smooth[0] if dir_f else self.smooth[-1]
+
+                yield self.stripe_comment(y, dir_f)
+
+                if first:
+                    yield from self._move_z("G0", self.z_clear)
+                    yield from self._move_xy("G0", fx, y, c_code)
+                    yield from self._move_z("G1", fz, self.f_plunge)
+                    first = False
+                else:
+                    yield from self._move_xy("G0", fx, y)
+                yield from self._move_y("G1", y, self.f_cut)
+
+                blk, end = (fwd, self.smooth[-1]) if dir_f else (rev, self.smooth[0])
+                if blk:
+                    yield self._enter_pass(blk, end)
+                    if not joined:
+                        yield from islice(blk, 1, None)
+                    elif len(blk) > 1:
+                        yield bodies[0 if dir_f else 1]
+
+                # move in Y only (stay at depth) if another stripe remains
+                if i + 1 < len(ys):
+                    yield from self._move_y("G1", ys[i + 1], self.f_plunge)
+
+                dir_f = not dir_f
+
+            yield "; ---- end smoothing ----"
+            if arcs:
+                yield "G17"
+            yield from self._move_z("G0", self.z_clear)
+            yield self.retract_line
+            self._last.pop("Z", None)
+
+        # ------------------- program end ------------------------------
+        yield from self.footer_lines()
+
+    def _text_chunks(self) -> Iterator[str]:
+        """What :meth:`write` emits, ``\\n``-separated; lines or joined runs."""
+        return self._program(joined=True)
+
+    def write(self, fh: TextIO) -> None:
+        """Stream the program to *fh*, lines separated by ``\\n``."""
+        chunks = self._text_chunks()
+        fh.write(next(chunks, ""))
+        for s in chunks:
+            fh.write("\n" + s)
+
+    # ------------------------------------------------------------------ #
+    def save(self, path: str | Path) -> Path:
+        """Write G‑code to *path* (with :attr:`file_suffix`) and return it."""
+        path = Path(path).with_suffix(self.file_suffix)
+        with path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+            self.write(fh)
+        print(f"G-code written to {path.resolve()}")
+        return path
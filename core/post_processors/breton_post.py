@@ -1,150 +1,63 @@
 from __future__ import annotations
-from pathlib import Path
-from typing import Sequence, Tuple, List
+from typing import Iterator, List
 
+from core.post_processors.base_post import _BaseSawPost
 
-class BretonPost:
+
+class BretonPost(_BaseSawPost):
     """Generate Breton-style G-code from point data."""
 
+    file_suffix = ".nc"
+
     def __init__(
         self,
-        points: Sequence,
-        smoothing_pts: Sequence | None = None,
+        points,
+        smoothing_pts=None,
         *,
-        blade_width: float = 3.5,
-        blade_diameter: float | None = None,
-        y_start: float,
-        y_end: float,
-        y_step: float | None = None,
-        z_clear: float,
-        z_max: float,
-        plunge_feed: float = 500.0,
-        cut_feed: float = 2000.0,
-        cut_feed_xy: float | None = None,
-        invert_xy: bool = False,
         orientation: str = "0.0000,0.0000,,,,0,0",
         work_plane: str = "0,0,0,0,0,0",
         line_numbers: bool = False,
+        **kwargs,
     ):
-        self.points: List[Tuple[float, float]] = [
-            (p.x(), p.y()) if hasattr(p, "x") else (p[0], p[1]) for p in points
-        ]
-        self.smooth: List[Tuple[float, float]] = [
-            (p.x(), p.y()) if hasattr(p, "x") else (p[0], p[1])
-            for p in (smoothing_pts or [])
-        ]
-
-        self.blade_w = blade_width
-        self.blade_d = blade_diameter
-        self.y0, self.y1 = y_start, y_end
-        self.y_step = abs(y_step or blade_width)
-        self.z_clear, self.z_max = z_clear, z_max
-
-        self.f_plunge = plunge_feed
-        self.f_cut = cut_feed
-        self.f_xy = cut_feed_xy or cut_feed
-
-        self.invert = invert_xy
+        super().__init__(points, smoothing_pts, **kwargs)
         self.orientation = orientation
         self.work_plane = work_plane
         self.number_lines = line_numbers
         self._counter = 1
 
     # ------------------------------------------------------------------ #
-    def _xyz(self, x: float | None = None, y: float | None = None, z: float | None = None) -> str:
-        if self.invert:
-            x, y = y, x
-        parts: list[str] = []
-        if x is not None:
-            parts.append(f"X{x:.2f}")
-        if y is not None:
-            parts.append(f"Y{y:.2f}")
-        if z is not None:
-            parts.append(f"Z{z:.2f}")
-        return "  ".join(parts)
-
-    def _line(self, text: str) -> str:
-        if self.number_lines:
-            prefix = f"N{self._counter} "
-            self._counter += 1
-            return prefix + text
-        return text
-
-    # ------------------------------------------------------------------ #
-    def generate(self) -> List[str]:
-        add = lambda s: ln.append(self._line(s))
-        ln: List[str] = []
-
-        # ------------------- header -----------------------------------
-        add("; Breton G-code")
-        add("BRETON_INIT(0)")
-        add("G518")
-        add("BRETON_WAREA(\"MILL\")")
-        add("BRETON_PRE_TOOL")
-        add("BRETON_CHGTOOL")
-        add("BRETON_POST_TOOL(5,0)")
-        add(f"BRETON_ORIENTATION({self.orientation})")
-        add(f"BRETON_SETWPLANE({self.work_plane})")
-        add("MS1")
-        add("M4S1600")
-        add("M07")
-
-        c_code = "C0 A0" if self.invert else "C-90 A0"
-
-        # ------------------- roughing ---------------------------------
-        for idx, (x, z) in enumerate(self.points, start=1):
-            add(f"; ---- Rough #{idx} ----")
-            add(f"G0  {self._xyz(z=self.z_clear)}")
-            add(f"G0  {self._xyz(x=x, y=self.y0)}  {c_code}")
-            add(f"G1  {self._xyz(z=z)}  F{self.f_plunge:.0f}")
-            add(f"G1  {self._xyz(y=self.y1)}  F{self.f_cut:.0f}")
-        add("M18")
-
-        # ------------------- smoothing --------------------------------
-        if self.smooth:
-            y = self.y0
-            step = -self.y_step if self.y0 > self.y1 else self.y_step
-            dir_f = True
-            first = True
-            cond = (lambda yy: yy >= self.y1) if step < 0 else (lambda yy: yy <= self.y1)
-
-            while cond(y):
-                seq = self.smooth if dir_f else list(reversed(self.smooth))
-                fx, fz = seq[0]
-
-                add(f"; ---- stripe Y={y:.2f} ----")
-
-                if first:
-                    add(f"G0  {self._xyz(z=self.z_clear)}")
-                    add(f"G0  {self._xyz(x=fx, y=y)}  {c_code}")
-                    add(f"G1  {self._xyz(z=fz)}  F{self.f_plunge:.0f}")
-                    first = False
-                else:
-                    add(f"G0  {self._xyz(x=fx, y=y)}")
-                add(f"G1  {self._xyz(y=y)}  F{self.f_cut:.0f}")
-
-                for x, z in seq:
-                    add(f"G1  {self._xyz(x=x, z=z)}  F{self.f_xy:.0f}")
-
-                y_next = y + step
-                if cond(y_next):
-                    add(f"G1  {self._xyz(y=y_next)}  F{self.f_plunge:.0f}")
-
-                y = y_next
-                dir_f = not dir_f
-
-            add("; ---- end smoothing ----")
-            add(f"G0  {self._xyz(z=self.z_clear)}")
-            add("M18")
-
-        # ------------------- footer -----------------------------------
-        add("BRETON_ENDPRG")
-        add("M30")
-        return ln
+    def iter_lines(self) -> Iterator[str]:
+        lines = self._program()
+        return self._numbered(lines) if self.number_lines else lines
+
+    def _numbered(self, lines: Iterator[str]) -> Iterator[str]:
+        n = self._counter
+        try:
+            for s in lines:
+                yield f"N{n} {s}"
+                n += 1
+        finally:
+            self._counter = n
+
+    def _text_chunks(self) -> Iterator[str]:
+        # every line needs its own N word, so nothing can be pre-joined
+        return self.iter_lines() if self.number_lines else self._program(joined=True)
+
+    def header_lines(self) -> List[str]:
+        return [
+            "; Breton G-code",
+            "BRETON_INIT(0)",
+            "G518",
+            "BRETON_WAREA(\"MILL\")",
+            "BRETON_PRE_TOOL",
+            "BRETON_CHGTOOL",
+            "BRETON_POST_TOOL(5,0)",
+            f"BRETON_ORIENTATION({self.orientation})",
+            f"BRETON_SETWPLANE({self.work_plane})",
+            "MS1",
+            "M4S1600",
+            "M07",
+        ]
 
-    # ------------------------------------------------------------------ #
-    def save(self, path: str | Path) -> Path:
-        path = Path(path).with_suffix(".nc")
-        path.write_text("\n".join(self.generate()), encoding="utf-8")
-        print(f"G-code written to {path.resolve()}")
-        return path
+    def footer_lines(self) -> List[str]:
+        return ["BRETON_ENDPRG", "M30"]
@@ -4,11 +4,15 @@ from __future__ import annotations
 from typing import List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 from core.dxf_probe import VerticalProbe
 
 # ------------------------------------------------------------------------- types
 Point = Tuple[float, float]  # (x, y)
 
+TILE = 1024                  # x-samples per batched probe call
+
 
 @dataclass
 class Path:
@@ -27,19 +31,22 @@ def sample_outline(
     offsets: int = 3,
 ) -> List[Point]:
     probe   = VerticalProbe(mspace)
-    offs    = [blade_width * i / (offsets - 1) for i in range(offsets)]
-
-    pts: List[Point] = []
-    x = xmin
-    while x <= xmax:
-        best_y = None
-        best_x = None
-        for dx in offs:
-            y = probe.highest_y(x + dx)
-            if y is not None and (best_y is None or y > best_y):
-                best_y = y
-                best_x = x + dx
-        if best_y is not None:
-            pts.append((x, best_y))   # <─ store true column of max Y
-        x += x_step
-    return pts
\ No newline at end of file
+    offs    = blade_width * np.arange(offsets) / (offsets - 1)
+
+    n = int(np.floor((xmax - xmin) / x_step + 1e-9)) + 1
+    if n <= 0:
+        return []
+    xs = xmin + x_step * np.arange(n)
+
+    # one probe per (column, sub-column), TILE columns at a time so the
+    # (columns × offsets) block stays cache-sized; keep each column's top hit
+    best_y = np.full(n, np.nan)
+    for t0 in range(0, n, TILE):
+        tile = xs[t0:t0 + TILE]
+        ys   = probe.highest_y_batch((tile[:, None] + offs[None, :]).ravel())
+        ys   = ys.reshape(tile.shape[0], offsets)
+        hit  = ~np.isnan(ys).all(axis=1)
+        best_y[t0:t0 + tile.shape[0]][hit] = np.nanmax(ys[hit], axis=1)
+
+    hit = ~np.isnan(best_y)
+    return list(zip(xs[hit].tolist(), best_y[hit].tolist()))
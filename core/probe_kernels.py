@@ -0,0 +1,89 @@
+# core/probe_kernels.py
+"""Compiled kernels for :class:`core.dxf_probe.VerticalProbe`.
+
+numba is optional: when it is missing ``highest_y_kernel`` is ``None`` and
+the probe keeps using its NumPy implementation.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:          # pragma: no cover - optional dependency
+    njit = None
+
+# (xs, circle cx/cy/r, line x1/y1/x2/y2,
+#  arc cx/cy/r/cos_s/sin_s/cos_e/sin_e/big) -> ys
+_SIGNATURE = "f8[::1](" + ", ".join(["f8[::1]"] * 16) + ")"
+
+# fastmath without the no-NaN / no-inf assumptions: the kernel relies on both
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _isclose(a, b):
+    return abs(a - b) <= 1e-9 * max(abs(a), abs(b))
+
+
+def _on_arc(px, py, cs, ss, ce, se, big):
+    after_start = cs * py - ss * px >= 0.0
+    before_end = px * se - py * ce >= 0.0
+    return (after_start or before_end) if big > 0.0 else (after_start and before_end)
+
+
+def _highest_y_kernel(xs, cx, cy, r, lx1, ly1, lx2, ly2,
+                      acx, acy, ar, acs, ass, ace, ase, abig):
+    out = np.empty(xs.shape[0])
+    for j in prange(xs.shape[0]):
+        x = xs[j]
+        best = -np.inf
+
+        # lines first: no sqrt, and a good best early prunes more below
+        for i in range(lx1.shape[0]):
+            x1, x2 = lx1[i], lx2[i]
+            if _isclose(x1, x2):
+                if _isclose(x, x1):
+                    y = max(ly1[i], ly2[i])
+                    if y > best:
+                        best = y
+            elif min(x1, x2) <= x <= max(x1, x2):
+                y = ly1[i] + (x - x1) / (x2 - x1) * (ly2[i] - ly1[i])
+                if y > best:
+                    best = y
+
+        # circles and arcs come sorted by cy + r, highest first
+        for i in range(cx.shape[0]):
+            if cy[i] + r[i] <= best:
+                break
+            dx = x - cx[i]
+            d = r[i] * r[i] - dx * dx
+            if d >= 0.0:
+                y = cy[i] + math.sqrt(d)
+                if y > best:
+                    best = y
+
+        for i in range(acx.shape[0]):
+            if acy[i] + ar[i] <= best:
+                break
+            dx = x - acx[i]
+            d = ar[i] * ar[i] - dx * dx
+            if d < 0.0:
+                continue
+            dy = math.sqrt(d)
+            for sy in (dy, -dy):
+                if (acy[i] + sy > best
+                        and _on_arc(dx, sy, acs[i], ass[i], ace[i], ase[i], abig[i])):
+                    best = acy[i] + sy
+
+        out[j] = best if best > -np.inf else np.nan
+    return out
+
+
+if njit is not None:
+    _isclose = njit(inline="always")(_isclose)
+    _on_arc = njit(inline="always")(_on_arc)
+    highest_y_kernel = njit(_SIGNATURE, parallel=True, fastmath=_FASTMATH,
+                            cache=True)(_highest_y_kernel)
+else:
+    highest_y_kernel = None
@@ -10,6 +10,8 @@ class Dxf:
         self.path = path
         self.doc  = doc
         self.msp  = doc.modelspace()
+        self._movers = None      # (translate methods, start/end entities)
+        self.x_shift = 0.0       # total translate_x since the file was read
 
     # ----- factory ---------------------------------------------------------
     @classmethod
@@ -28,10 +30,17 @@ class Dxf:
 
     def translate_x(self, dx: float) -> None:
         """Translate all entities in model space along the X axis."""
-        for e in self.msp:
-            try:
-                e.translate(dx, 0, 0)
-            except AttributeError:
-                if hasattr(e.dxf, "start"):
-                    e.dxf.start.x += dx
-                    e.dxf.end.x += dx
+        if self._movers is None:             # sorted once; the drawing is not edited
+            ents = list(self.msp)
+            self._movers = (
+                [e.translate for e in ents if hasattr(e, "translate")],
+                [e for e in ents
+                 if not hasattr(e, "translate") and hasattr(e.dxf, "start")],
+            )
+        translates, lines = self._movers
+        for t in translates:
+            t(dx, 0, 0)
+        for e in lines:
+            e.dxf.start.x += dx
+            e.dxf.end.x += dx
+        self.x_shift += dx
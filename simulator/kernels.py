@@ -0,0 +1,58 @@
+# ===============================
+# file: kernels.py
+# ===============================
+"""Compiled pose interpolation for :mod:`simulator.parser`.
+
+numba is optional: when it is missing ``interp_kernel`` is ``None`` and the
+parser keeps using its NumPy implementation.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # pragma: no cover - optional dependency
+    njit = None
+
+# (moves (m, 8) = x0, y0, z0, x, y, z, c, g;  step_mm) -> (xyzc, g)
+_SIGNATURE = "Tuple((f4[:, ::1], u1[::1]))(f8[:, ::1], f8)"
+
+
+def _interp_kernel(moves, step_mm):
+    # pass 1: points per move (start exclusive, end inclusive)
+    m = moves.shape[0]
+    counts = np.empty(m, np.int64)
+    total = 0
+    for i in range(m):
+        dx = moves[i, 3] - moves[i, 0]
+        dy = moves[i, 4] - moves[i, 1]
+        dz = moves[i, 5] - moves[i, 2]
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
+        k = max(1, int(length / step_mm)) if length > 0.0 else 0
+        counts[i] = k
+        total += k
+
+    # pass 2: write every point straight into the output
+    xyzc = np.empty((total, 4), np.float32)
+    g = np.empty(total, np.uint8)
+    j = 0
+    for i in range(m):
+        k = counts[i]
+        x0, y0, z0 = moves[i, 0], moves[i, 1], moves[i, 2]
+        dx, dy, dz = moves[i, 3] - x0, moves[i, 4] - y0, moves[i, 5] - z0
+        for s in range(1, k + 1):
+            t = s / k
+            xyzc[j, 0] = x0 + t * dx
+            xyzc[j, 1] = y0 + t * dy
+            xyzc[j, 2] = z0 + t * dz
+            xyzc[j, 3] = moves[i, 6]
+            g[j] = np.uint8(moves[i, 7])
+            j += 1
+    return xyzc, g
+
+
+if njit is not None:
+    interp_kernel = njit(_SIGNATURE, cache=True)(_interp_kernel)
+else:
+    interp_kernel = None
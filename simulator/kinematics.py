@@ -2,29 +2,65 @@
 # file: kinematics.py
 # ===============================
 from typing import Dict
+import numpy as np
+from PyQt5.QtGui import QMatrix4x4
 from pyqtgraph.opengl import GLMeshItem
 
 SCALE_MM   = 0.1            # 1 viewer unit = 10 mm
 BLADE_R_MM = 200.0          # keep in sync with machine.make_blade
 
+def pose_matrices(xyzc: np.ndarray) -> np.ndarray:
+    """
+    Blade world transforms for poses ``xyzc`` (N, 4) as (N, 16) float32,
+    row-major – the matrix :meth:`Blade4X.apply` builds, for all at once.
+    translate · Rz(C) · Rx(90°) has rotation part
+        [[cos C, 0,  sin C],
+         [sin C, 0, −cos C],
+         [0,     1,  0    ]]
+    """
+    c  = np.radians(xyzc[:, 3].astype(float))
+    cs, sn = np.cos(c), np.sin(c)
+    m = np.zeros((len(xyzc), 4, 4), np.float32)
+    m[:, 0, 0], m[:, 0, 2] = cs, sn
+    m[:, 1, 0], m[:, 1, 2] = sn, -cs
+    m[:, 2, 1] = 1.0
+    m[:, 3, 3] = 1.0
+    m[:, 0, 3] = xyzc[:, 0] * SCALE_MM
+    m[:, 1, 3] = xyzc[:, 1] * SCALE_MM
+    m[:, 2, 3] = (xyzc[:, 2].astype(float) + BLADE_R_MM) * SCALE_MM
+    return m.reshape(-1, 16)
+
 class Blade4X:
     """Disc follows X, Y, Z, C.  Bottom edge traces the programmed path."""
 
+    POSE_BLOCK = 65536          # poses per precomputed matrix block (4 MB)
+
     def __init__(self, parts: Dict[str, GLMeshItem]):
         self.blade = parts["blade"]
+        self._lo   = -1                           # first pose of _mats
+        self._mats = np.empty((0, 16), np.float32)
+
+        # stand the disc upright (XY → XZ plane) – the same for every pose
+        self._upright = QMatrix4x4()
+        self._upright.rotate(90, 1, 0, 0)
 
     def apply(self, x_mm: float, y_mm: float, z_mm: float, c_deg: float):
         cx = x_mm * SCALE_MM
         cy = y_mm * SCALE_MM
         cz = (z_mm + BLADE_R_MM) * SCALE_MM
 
-        self.blade.resetTransform()
-
-        # ① stand the disc upright (XY → XZ plane)   …world-axis rotation
-        self.blade.rotate(90, 1, 0, 0, local=False)
-
-        # ② swivel around the world Z-axis by C degrees
-        self.blade.rotate(c_deg, 0, 0, 1, local=False)
+        # world transform = move · swivel about Z by C · upright, built in
+        # one matrix so the bottom tip hits the programmed XYZ
+        m = QMatrix4x4()
+        m.translate(cx, cy, cz)
+        m.rotate(c_deg, 0, 0, 1)
+        m *= self._upright
+        self.blade.setTransform(m)
 
-        # ③ move the centre so the bottom tip hits the programmed XYZ
-        self.blade.translate(cx, cy, cz)
\ No newline at end of file
+    def apply_pose(self, poses: np.ndarray, i: int):
+        """Same as ``apply(*poses[i])``, from a matrix block built in one go."""
+        lo = i - i % self.POSE_BLOCK
+        if lo != self._lo or i - lo >= len(self._mats):   # new or grown block
+            self._mats = pose_matrices(poses[lo:lo + self.POSE_BLOCK])
+            self._lo   = lo
+        self.blade.setTransform(QMatrix4x4(*self._mats[i - lo].tolist()))
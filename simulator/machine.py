@@ -40,30 +40,23 @@ def _disc_mesh(radius: float, half_t: float, sectors: int = 64) -> MeshData:
     i_bot_ring   = 2 + sectors
 
     # ------- faces -----------------------------------------------------
-    faces = []
-
-    # top cap fan
-    for i in range(sectors):
-        faces.append([i_top_center,
-                      i_top_ring + i,
-                      i_top_ring + (i + 1) % sectors])
-
-    # bottom cap fan
-    for i in range(sectors):
-        faces.append([i_bot_center,
-                      i_bot_ring + (i + 1) % sectors,
-                      i_bot_ring + i])
-
-    # rim (two tris per sector)
-    for i in range(sectors):
-        a = i_top_ring + i
-        b = i_top_ring + (i + 1) % sectors
-        c = i_bot_ring + i
-        d = i_bot_ring + (i + 1) % sectors
-        faces.extend([[a, b, d], [a, d, c]])
-
-    faces = np.array(faces, dtype=int)
-    return MeshData(vertexes=vertices, faces=faces)
+    i  = np.arange(sectors)
+    ip = (i + 1) % sectors
+
+    # top / bottom cap fans (bottom wound the other way)
+    top_fan = np.stack((np.full(sectors, i_top_center),
+                        i_top_ring + i, i_top_ring + ip), axis=1)
+    bot_fan = np.stack((np.full(sectors, i_bot_center),
+                        i_bot_ring + ip, i_bot_ring + i), axis=1)
+
+    # rim (two tris per sector, kept adjacent)
+    a, b = i_top_ring + i, i_top_ring + ip
+    c, d = i_bot_ring + i, i_bot_ring + ip
+    rim = np.stack((np.stack((a, b, d), axis=1),
+                    np.stack((a, d, c), axis=1)), axis=1).reshape(-1, 3)
+
+    faces = np.vstack((top_fan, bot_fan, rim)).astype(np.uint32)
+    return MeshData(vertexes=vertices.astype(np.float32), faces=faces)
 
 
 def make_blade(radius_mm: float = 200.0,
@@ -1,53 +1,89 @@
 # ===============================
 # file: parser.py
 # ===============================
-from typing import Iterator, Dict, Tuple, List
-import re, math
+from typing import Iterator, Tuple, List
+from itertools import chain
+import re
+
+import numpy as np
+
+from .kernels import interp_kernel              # None without numba
 
 STEP_MM = 1.0                          # segment length for interpolation
 _EXPR   = re.compile(r'([A-Z])([-+]?\d*\.?\d+)')
 
-def _parse(line: str) -> Dict[str, float]:
-    return {m[0]: float(m[1]) for m in _EXPR.findall(line.upper())}
-
-def _interp(p0: Tuple[float, float, float],
-            p1: Tuple[float, float, float]) -> List[Tuple[float, float, float]]:
-    dx, dy, dz = (p1[i] - p0[i] for i in range(3))
-    length = math.hypot(math.hypot(dx, dy), dz)
-    if length == 0:
-        return []
-    n = max(1, int(length / STEP_MM))
-    return [(p0[0] + dx * i / n,
-             p0[1] + dy * i / n,
-             p0[2] + dz * i / n) for i in range(1, n + 1)]
-
-def pose_stream(path: str) -> Iterator[Dict[str, float]]:
+def _interp(p0: np.ndarray, p1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Yields dicts  {"X":..,"Y":..,"Z":..,"C":..,"G":0|1}
-    Handles modal G-codes: a G word is sticky until another appears.
-    Only G0 and G1 moves are emitted.
+    Interpolate every segment p0[i] → p1[i] (both ``(m, 3)``) in one pass.
+    Returns ``(points, seg)``: points every ~STEP_MM along each segment
+    (start exclusive, end inclusive) and the segment each point belongs to.
+    Zero-length segments contribute no points.
+    """
+    d      = p1 - p0
+    length = np.sqrt((d * d).sum(axis=1))
+    n      = np.where(length > 0, np.maximum(1, (length / STEP_MM).astype(int)), 0)
+    seg    = np.repeat(np.arange(len(n)), n)
+    first  = np.cumsum(n) - n                          # index of each segment's 1st point
+    t      = (np.arange(len(seg)) - first[seg] + 1) / n[seg]
+    return p0[seg] + t[:, None] * d[seg], seg
+
+def _poses(rows: List[Tuple[float, ...]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Interpolated ``(xyzc, g)`` arrays for ``(x0,y0,z0,x,y,z,c,g)`` rows."""
+    if not rows:
+        return np.empty((0, 4), np.float32), np.empty(0, np.uint8)
+    m        = np.fromiter(chain.from_iterable(rows), float,
+                           count=8 * len(rows)).reshape(-1, 8)
+    if interp_kernel is not None:
+        return interp_kernel(m, STEP_MM)
+    pts, seg = _interp(m[:, 0:3], m[:, 3:6])
+    cs, gs   = m[seg, 6], m[seg, 7]
+    xyzc = np.empty((len(seg), 4), np.float32)
+    xyzc[:, :3] = pts
+    xyzc[:, 3]  = cs
+    return xyzc, gs.astype(np.uint8)
+
+def pose_chunks(path: str, batch: int = 100_000) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
     """
-    modal = {"X": 0.0, "Y": 0.0, "Z": 0.0, "C": 0.0, "G": 1}   # default to G1
+    Same poses as :func:`pose_stream`, yielded as ``(xyzc, g)`` arrays every
+    *batch* source lines so a caller can start on the first part of a big
+    file. Modal state carries over between chunks; a chunk may be empty.
+    """
+    # modal state lives in locals; each move is one (start, end, C, G) row
+    x = y = z = c = 0.0
+    g = 1                                                   # default to G1
+    rows: List[Tuple[float, ...]] = []
+    words = _EXPR.findall
     with open(path) as fh:
-        for raw in fh:
+        for n, raw in enumerate(fh, 1):
+            if n % batch == 0:
+                yield _poses(rows); rows = []
+
             raw = raw.partition(";")[0].strip()
             if not raw:
                 continue
-            words = _parse(raw)
 
-            start = (modal["X"], modal["Y"], modal["Z"])
+            x0, y0, z0 = x, y, z
+            for k, v in words(raw.upper()):
+                if   k == "X": x = float(v)
+                elif k == "Y": y = float(v)
+                elif k == "Z": z = float(v)
+                elif k == "C": c = float(v)
+                elif k == "G": g = int(float(v))
 
-            # update modal state -----------------------------
-            if "G" in words:
-                modal["G"] = int(words["G"])
-            for k in "XYZC":
-                if k in words:
-                    modal[k] = words[k]
+            if g == 0 or g == 1:                            # ignore G2/3 for now
+                rows.append((x0, y0, z0, x, y, z, c, g))
+    yield _poses(rows)
 
-            if modal["G"] not in (0, 1):
-                continue                                    # ignore G2/3 for now
-
-            end = (modal["X"], modal["Y"], modal["Z"])
-            for x, y, z in _interp(start, end):
-                yield {"X": x, "Y": y, "Z": z,
-                       "C": modal["C"], "G": modal["G"]}
+def pose_stream(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the poses as two parallel arrays:
+        xyzc  float32 (N, 4)   X, Y, Z, C per pose
+        g     uint8   (N,)     0 | 1
+    Handles modal G-codes: a G word is sticky until another appears.
+    Only G0 and G1 moves are emitted.
+    """
+    chunks = list(pose_chunks(path))
+    if len(chunks) == 1:
+        return chunks[0]
+    return (np.concatenate([xyzc for xyzc, _ in chunks]),
+            np.concatenate([g for _, g in chunks]))
@@ -4,17 +4,20 @@
 """
 Minimal Qt 3D viewer (PyQt5)
 • STL (or OBJ/PLY) loaded with QMesh
-• XY grid built from thin cylinders
+• XY grid drawn as one GL_LINES geometry
 • Orbit/zoom camera via QOrbitCameraController
 """
 import os, sys
+import numpy as np
 from PyQt5 import QtWidgets, QtGui, QtCore
 
 from PyQt5.Qt3DCore    import QEntity, QTransform
-from PyQt5.Qt3DRender  import QMesh, QCamera
+from PyQt5.Qt3DRender  import (
+    QMesh, QCamera, QAttribute, QBuffer, QGeometry, QGeometryRenderer
+)
 from PyQt5.Qt3DExtras  import (
     Qt3DWindow, QOrbitCameraController,
-    QPhongMaterial, QCylinderMesh
+    QPhongMaterial
 )
 
 from PyQt5.QtCore      import QUrl
@@ -24,44 +27,51 @@ STL_PATH = os.path.abspath("head.stl")
 
 # ----------------------------------------------------------------------
 def build_grid(size_x=3500, size_y=2000, step=100, parent=None):
-    """Return an entity drawing an XY grid centred at the origin."""
-    grid_root = QEntity(parent)
-
-    # reusable cylinder mesh (thin line)
-    cyl_x = QCylinderMesh()
-    cyl_x.setRadius(1.0)
-    cyl_x.setLength(size_x)
-    cyl_x.setRings(4)
-    cyl_x.setSlices(8)
+    """Return an entity drawing an XY grid centred at the origin.
+
+    All grid lines live in one vertex buffer drawn as GL_LINES, so the grid
+    is a single entity / draw call however fine *step* is.
+    """
+    hx, hy = size_x // 2, size_y // 2
+    ys = np.arange(-hy, hy + 1, step, dtype=np.float32)
+    xs = np.arange(-hx, hx + 1, step, dtype=np.float32)
+
+    # endpoint pairs: lines along X (one per y), then lines along Y (per x)
+    along_x = np.zeros((len(ys), 2, 3), np.float32)
+    along_x[:, 0, 0], along_x[:, 1, 0] = -hx, hx
+    along_x[:, :, 1] = ys[:, None]
+    along_y = np.zeros((len(xs), 2, 3), np.float32)
+    along_y[:, :, 0] = xs[:, None]
+    along_y[:, 0, 1], along_y[:, 1, 1] = -hy, hy
+    verts = np.concatenate((along_x, along_y)).reshape(-1, 3)
 
-    cyl_y = QCylinderMesh()
-    cyl_y.setRadius(1.0)
-    cyl_y.setLength(size_y)
-    cyl_y.setRings(4)
-    cyl_y.setSlices(8)
-
-    mat = QPhongMaterial(parent)
+    grid_root = QEntity(parent)
+    geom = QGeometry(grid_root)
+
+    buf = QBuffer(geom)
+    buf.setData(QtCore.QByteArray(verts.tobytes()))
+
+    pos = QAttribute(geom)
+    pos.setName(QAttribute.defaultPositionAttributeName())
+    pos.setAttributeType(QAttribute.VertexAttribute)
+    pos.setVertexBaseType(QAttribute.Float)
+    pos.setVertexSize(3)
+    pos.setByteStride(3 * 4)
+    pos.setCount(len(verts))
+    pos.setBuffer(buf)
+    geom.addAttribute(pos)
+
+    lines = QGeometryRenderer(grid_root)
+    lines.setPrimitiveType(QGeometryRenderer.Lines)
+    lines.setGeometry(geom)
+
+    # lines carry no normals: let the ambient term give them their colour
+    mat = QPhongMaterial(grid_root)
+    mat.setAmbient(QtGui.QColor(140, 140, 140))
     mat.setDiffuse(QtGui.QColor(140, 140, 140))
 
-    # parallel to Y-axis (lines along X)
-    for y in range(-size_y // 2, size_y // 2 + 1, step):
-        ent  = QEntity(grid_root)
-        ent.addComponent(cyl_x)
-        xf   = QTransform()
-        xf.setTranslation(QVector3D(0, y, 0))
-        xf.setRotation(QtGui.QQuaternion.fromEulerAngles(90, 0, 0))
-        ent.addComponent(xf)
-        ent.addComponent(mat)
-
-    # parallel to X-axis (lines along Y)
-    for x in range(-size_x // 2, size_x // 2 + 1, step):
-        ent  = QEntity(grid_root)
-        ent.addComponent(cyl_y)
-        xf   = QTransform()
-        xf.setTranslation(QVector3D(x, 0, 0))
-        ent.addComponent(xf)
-        ent.addComponent(mat)
-
+    grid_root.addComponent(lines)
+    grid_root.addComponent(mat)
     return grid_root
 # ----------------------------------------------------------------------
 
@@ -10,6 +10,7 @@ PyQtGraph 3-D viewer bootstrap:
 """
 
 import sys
+import functools
 import numpy as np
 from PyQt5 import QtWidgets, QtGui, QtCore
 import pyqtgraph as pg
@@ -31,6 +32,12 @@ except ImportError:
     stlmesh = None
     print("numpy-stl is not installed; STL loading will be skipped.")
 
+@functools.lru_cache(maxsize=8)
+def _sphere_meshdata(rows: int, cols: int, radius: float) -> MeshData:
+    """Shared sphere mesh – items only read it, so one build per shape."""
+    return MeshData.sphere(rows=rows, cols=cols, radius=radius)
+
+
 class GCodeViewer(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -61,11 +68,12 @@ class GCodeViewer(QtWidgets.QMainWindow):
         self.add_origin_sphere()
 
     # ------------------------------------------------------------------
-    def add_machine_mesh(self, path: str):
+    def add_machine_mesh(self, path: str, dedup: bool = False):
         """
         Load an STL and drop it into the scene.
         Split your real model into X-bridge / Y-carriage / Z-head…
         for independent motion; here we just add one static body.
+        *dedup* welds the corners STL repeats for every triangle.
         """
         if stlmesh is None:
             return
@@ -78,8 +86,13 @@ class GCodeViewer(QtWidgets.QMainWindow):
                 f"Could not load {path}\n{exc}")
             return
 
-        verts  = raw.vectors.reshape(-1, 3)
-        faces  = np.arange(len(verts)).reshape(-1, 3)
+        # float32 / uint32: the types GL takes without a per-draw copy
+        verts  = np.ascontiguousarray(raw.vectors.reshape(-1, 3), np.float32)
+        if dedup:
+            verts, inv = np.unique(verts, axis=0, return_inverse=True)
+            faces = inv.astype(np.uint32).reshape(-1, 3)
+        else:
+            faces = np.arange(len(verts), dtype=np.uint32).reshape(-1, 3)
         body   = gl.GLMeshItem(vertexes=verts,
                                faces=faces,
                                smooth=False,
@@ -129,7 +142,7 @@ class GCodeViewer(QtWidgets.QMainWindow):
         corner_y = -sy / 2.0        # front edge (toward camera)
 
         # 3.  Build + position the sphere ---------------------------
-        meshdata = gl.MeshData.sphere(rows=20, cols=20, radius=radius)
+        meshdata = _sphere_meshdata(20, 20, radius)
         sphere   = gl.GLMeshItem(meshdata=meshdata,
                                  smooth=True,
                                  color=(1, 1, 0, 1),   # yellow
@@ -2,13 +2,20 @@
 # file: viewer.py  (rev 2025‑07‑21b)
 # Chunk‑&‑freeze rendering + restored camera, pan & rotate behaviour
 # ===============================
+import math
 from PyQt5 import QtCore, QtWidgets, QtGui
 import numpy as np
+from OpenGL import GL
 from pyqtgraph.opengl import (
     GLViewWidget, GLLinePlotItem, GLMeshItem, MeshData
 )
+from pyqtgraph.opengl.GLGraphicsItem import GLGraphicsItem, GLOptions
+try:                        # newer pyqtgraph: view logic apart from the widget
+    from pyqtgraph.opengl.GLViewWidget import GLViewMixin
+except ImportError:
+    GLViewMixin = None
 
-from .parser     import pose_stream
+from .parser     import pose_chunks
 from .machine    import make_blade
 from .kinematics import Blade4X, SCALE_MM
 
@@ -16,33 +23,110 @@ from .kinematics import Blade4X, SCALE_MM
 # ────────────────────────────────────────────────────────────────────
 # Geometry helper – draw a translucent stock slab (double‑sided)
 # ────────────────────────────────────────────────────────────────────
+# translucent, and both windings rasterised – one copy of each face is enough
+_TWO_SIDED = {**GLOptions['translucent'], GL.GL_CULL_FACE: False}
+
+# two triangles per quad, each face once; GL draws both sides
+_BOX_FACES = np.array([
+    [0, 1, 2], [0, 2, 3], [1, 5, 6], [1, 6, 2], [5, 4, 7], [5, 7, 6],
+    [4, 0, 3], [4, 3, 7], [3, 2, 6], [3, 6, 7], [4, 5, 1], [4, 1, 0],
+], np.uint32)
+_BOX_MESHES: dict = {}      # size bytes -> MeshData, shared by every dock
+
+
 def make_double_sided_box(size: np.ndarray,
                           rgba=(0.2, 0.6, 1.0, 0.25)) -> GLMeshItem:
-    """Return a cube mesh whose faces are duplicated back‑to‑front."""
-    x, y, z = size / 2.0
-    v = np.array([
-        [-x, -y,  z], [ x, -y,  z], [ x,  y,  z], [-x,  y,  z],
-        [-x, -y, -z], [ x, -y, -z], [ x,  y, -z], [-x,  y, -z],
-    ])
-    quads = [
-        [0, 1, 2, 3], [1, 5, 6, 2], [5, 4, 7, 6],
-        [4, 0, 3, 7], [3, 2, 6, 7], [4, 5, 1, 0],
-    ]
-    faces = []
-    for q in quads:                               # front
-        faces += [[q[0], q[1], q[2]], [q[0], q[2], q[3]]]
-        faces += [[q[2], q[1], q[0]], [q[3], q[2], q[0]]]  # back
-    md = MeshData(vertexes=v.astype(float),
-                  faces=np.asarray(faces, int))
+    """Return a cube mesh drawn from both sides (back faces not culled)."""
+    key = np.asarray(size, float).tobytes()
+    md = _BOX_MESHES.get(key)
+    if md is None:                    # geometry only; colour is per item
+        x, y, z = size / 2.0
+        v = np.array([
+            [-x, -y,  z], [ x, -y,  z], [ x,  y,  z], [-x,  y,  z],
+            [-x, -y, -z], [ x, -y, -z], [ x,  y, -z], [-x,  y, -z],
+        ], np.float32)
+        md = _BOX_MESHES[key] = MeshData(vertexes=v, faces=_BOX_FACES)
     return GLMeshItem(meshdata=md, smooth=False,
                       drawFaces=True, drawEdges=False,
-                      color=rgba, glOptions='translucent')
+                      color=rgba, glOptions=_TWO_SIDED)
+
+
+# ────────────────────────────────────────────────────────────────────
+# Tail line item – vertices kept in a VBO, only new rows uploaded
+# ────────────────────────────────────────────────────────────────────
+# pyqtgraph releases that draw with their own shaders + MVP uniform have
+# no fixed‑function matrices for us to draw under; those keep stock paint
+_LEGACY_GL = not hasattr(GLGraphicsItem, "mvpMatrix")
+
+
+class GrowingLinePlotItem(GLLinePlotItem):
+    """Line strip that only grows, or restarts from empty.
+
+    Stock GLLinePlotItem hands its whole array to GL on every paint. Here
+    the rows live in one VBO of *capacity* vertices and a paint uploads just
+    those added since the last one (glBufferSubData). Callers must not
+    change rows they have already passed to setData, except by clearing.
+    """
+
+    def __init__(self, capacity: int, **kw):
+        self._cap  = capacity
+        self._vbo  = None
+        self._sent = 0                # rows already in the VBO
+        self._rows = None
+        super().__init__(**kw)
+
+    def setData(self, **kw):
+        pos = kw.get("pos")
+        if pos is not None:
+            self._rows = pos
+            if len(pos) < self._sent:
+                self._sent = 0        # cleared: refill from the top
+        super().setData(**kw)
+
+    def paint(self):
+        rows = self._rows
+        if (not _LEGACY_GL or rows is None or len(rows) > self._cap
+                or not isinstance(self.color, tuple)):
+            return super().paint()
+        n = len(rows)
+        if not n:
+            return
+        self.setupGLState()
+
+        if self._vbo is None:
+            self._vbo = GL.glGenBuffers(1)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, self._cap * 12, None,
+                            GL.GL_DYNAMIC_DRAW)
+            self._sent = 0
+        else:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+        if n > self._sent:
+            new = np.ascontiguousarray(rows[self._sent:n], np.float32)
+            GL.glBufferSubData(GL.GL_ARRAY_BUFFER, self._sent * 12,
+                               new.nbytes, new)
+            self._sent = n
+
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        try:
+            GL.glVertexPointer(3, GL.GL_FLOAT, 0, None)
+            GL.glColor4f(*self.color)
+            GL.glLineWidth(self.width)
+            if self.antialias:
+                GL.glEnable(GL.GL_LINE_SMOOTH)
+                GL.glEnable(GL.GL_BLEND)
+                GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+                GL.glHint(GL.GL_LINE_SMOOTH_HINT, GL.GL_NICEST)
+            GL.glDrawArrays(GL.GL_LINE_STRIP, 0, n)
+        finally:
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
 
 # ────────────────────────────────────────────────────────────────────
 # View widget – original orbit (LMB) + screen‑plane pan (MMB/RMB)
 # ────────────────────────────────────────────────────────────────────
-class SmoothGLView(GLViewWidget):
+class _SmoothNav:
     """Exactly the feel of the pre‑refactor viewer:  
        • LMB   – orbit • MMB / RMB – pan in view plane."""
     ROT_SENS = 0.1          # ° per pixel
@@ -53,6 +137,8 @@ class SmoothGLView(GLViewWidget):
         super().__init__(*a, **kw)
         self._last_orbit = None
         self._last_pan   = None
+        self._basis_stamp = None      # (azimuth, elevation) of _basis
+        self._basis       = None      # screen right / up, world coords
 
     # ---------- mouse -------------------------------------------------
     def mousePressEvent(self, ev):
@@ -87,17 +173,60 @@ class SmoothGLView(GLViewWidget):
         super().mouseReleaseEvent(ev)
 
     # ---------- helper ------------------------------------------------
+    def _screen_basis(self):
+        """(right, up) unit vectors of the view plane; cached per camera angle.
+
+        With fwd = −(cos el·cos az, cos el·sin az, sin el):
+        right = ẑ × fwd normalised, up = fwd × right – in closed form.
+        """
+        stamp = (self.opts['azimuth'], self.opts['elevation'])
+        if stamp != self._basis_stamp:
+            az, el = math.radians(stamp[0]), math.radians(stamp[1])
+            sa, ca, se, ce = math.sin(az), math.cos(az), math.sin(el), math.cos(el)
+            self._basis = ((sa, -ca, 0.0), (-se*ca, -se*sa, ce))
+            self._basis_stamp = stamp
+        return self._basis
+
     def _pan_screen(self, dx_px: float, dy_px: float):
-        az = np.deg2rad(self.opts['azimuth'])
-        el = np.deg2rad(self.opts['elevation'])
-        fwd = np.array([-np.cos(el)*np.cos(az),
-                        -np.cos(el)*np.sin(az),
-                        -np.sin(el)])
-        right = np.cross([0, 0, 1], fwd); right /= np.linalg.norm(right)
-        upvec = np.cross(fwd, right);     upvec /= np.linalg.norm(upvec)
-        move  = (dx_px*right + dy_px*upvec) * self.opts['distance'] * self.PAN_SENS
-        self.opts['center'] += QtGui.QVector3D(*move)
-        self.update()
+        (rx, ry, rz), (ux, uy, uz) = self._screen_basis()
+        k = self.opts['distance'] * self.PAN_SENS
+        a, b = dx_px * k, dy_px * k
+        self.opts['center'] += QtGui.QVector3D(a*rx + b*ux, a*ry + b*uy, a*rz + b*uz)
+        self.update()                 # Qt merges queued repaints into one
+
+
+class SmoothGLView(_SmoothNav, GLViewWidget):
+    """The navigation on a QOpenGLWidget (fallback when there is no mixin)."""
+
+
+if GLViewMixin is not None:
+    class GLNativeView(_SmoothNav, GLViewMixin, QtGui.QOpenGLWindow):
+        """The same view in its own native window.
+
+        Embedded with ``QWidget.createWindowContainer`` it renders straight
+        to its surface; a QOpenGLWidget is drawn to a texture that the main
+        window composites on every widget repaint.
+        """
+else:
+    GLNativeView = None
+
+# ────────────────────────────────────────────────────────────────────
+# Background G-code parse – poses arrive in chunks on the UI thread
+# ────────────────────────────────────────────────────────────────────
+class PoseLoader(QtCore.QThread):
+    chunkReady = QtCore.pyqtSignal(np.ndarray, np.ndarray)   # xyzc, g
+
+    def __init__(self, gcode_file: str, parent=None):
+        super().__init__(parent)
+        self._path = gcode_file
+
+    def run(self):
+        for xyzc, g in pose_chunks(self._path):
+            if self.isInterruptionRequested():
+                return
+            if len(g):
+                self.chunkReady.emit(xyzc, g)
+
 
 # ────────────────────────────────────────────────────────────────────
 # Simulator dock widget
@@ -111,7 +240,11 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         self.setFeatures(self.NoDockWidgetFeatures)
 
         # 1 — GL scene ------------------------------------------------
-        self.view = SmoothGLView()
+        if GLNativeView is not None:
+            self.view = GLNativeView()
+            view_box  = QtWidgets.QWidget.createWindowContainer(self.view)
+        else:
+            self.view = view_box = SmoothGLView()
         self.view.setBackgroundColor(QtGui.QColor("#202030"))
 
         # blade model
@@ -125,21 +258,42 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         self.view.addItem(slab)
 
         # 2 — path containers ----------------------------------------
-        self.verts_g0, self.verts_g1 = [], []  # entire history
-        self.tail_g0,  self.tail_g1  = [], []  # only the “live” tail
-        self._frozen_items           = []      # static chunks
-
-        # tail line items (updated every frame)
-        self.path_g0 = GLLinePlotItem(width=1.5, antialias=True,
-                                      color=(0.3, 0.3, 0.3, 0.6))
-        self.path_g1 = GLLinePlotItem(width=2.0, antialias=True,
-                                      color=(1.0, 1.0, 0.0, 1.0))
+        # float32 throughout; frozen chunks + live tail = the whole history
+        # only the “live” tail: preallocated, filled up to n0 / n1
+        # (+2: a NaN break can land on a full tail before it freezes)
+        self.tail_g0 = np.empty((self.CHUNK_SIZE + 2, 3), np.float32)
+        self.tail_g1 = np.empty((self.CHUNK_SIZE + 2, 3), np.float32)
+        self.n0 = self.n1 = 0
+        self.dirty0 = self.dirty1 = False      # tail grew since last upload
+        # frozen chunks: one growing buffer + one line item per move type,
+        # chunks separated by NaN rows (filled up to nf0 / nf1)
+        self.frozen_g0 = np.empty((4 * self.CHUNK_SIZE, 3), np.float32)
+        self.frozen_g1 = np.empty((4 * self.CHUNK_SIZE, 3), np.float32)
+        self.nf0 = self.nf1 = 0
+        self.frozen_path_g0 = GLLinePlotItem(width=1.5, antialias=True,
+                                             color=(0.3, 0.3, 0.3, 0.6))
+        self.frozen_path_g1 = GLLinePlotItem(width=2.0, antialias=True,
+                                             color=(1.0, 1.0, 0.0, 1.0))
+        self.view.addItem(self.frozen_path_g0)
+        self.view.addItem(self.frozen_path_g1)
+
+        # tail line items (updated every frame, only new rows uploaded)
+        self.path_g0 = GrowingLinePlotItem(len(self.tail_g0), width=1.5,
+                                           antialias=True,
+                                           color=(0.3, 0.3, 0.3, 0.6))
+        self.path_g1 = GrowingLinePlotItem(len(self.tail_g1), width=2.0,
+                                           antialias=True,
+                                           color=(1.0, 1.0, 0.0, 1.0))
         self.view.addItem(self.path_g0)
         self.view.addItem(self.path_g1)
 
         # 3 — data helpers -------------------------------------------
         self._kin        = Blade4X(self.parts)
-        self._poses_all  = list(pose_stream(gcode_file))
+        # SoA pose buffer, filled by the loader; _xyzc / _g view the loaded part
+        self._xyzc_buf   = np.empty((0, 4), np.float32)
+        self._g_buf      = np.empty(0, np.uint8)
+        self._xyzc, self._g = self._xyzc_buf, self._g_buf
+        self._n_poses    = 0                      # len(self._g), kept by _add_poses
         self._cursor     = 0
         self._prev_g     = None
 
@@ -149,7 +303,7 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         # layout
         wrap = QtWidgets.QWidget()
         lay  = QtWidgets.QVBoxLayout(wrap); lay.setContentsMargins(0, 0, 0, 0)
-        lay.addWidget(self.view, 1); lay.addWidget(self.ctrls)
+        lay.addWidget(view_box, 1); lay.addWidget(self.ctrls)
         self.setWidget(wrap)
 
         # 5 — timer ---------------------------------------------------
@@ -160,6 +314,41 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         QtCore.QTimer.singleShot(0, self._set_start_camera)
         self._reset_scene()  # empties everything & zeroes blade
 
+        # 7 — parse in the background; playback can start on the 1st chunk
+        self._loading = True
+        self._loader  = PoseLoader(gcode_file, self)
+        self._loader.chunkReady.connect(self._add_poses)
+        self._loader.finished.connect(self._loaded)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._stop_loader)
+        self._loader.start()
+
+    # ----------------------------------------------------------------
+    # Pose loading
+    # ----------------------------------------------------------------
+    def _add_poses(self, xyzc, g):
+        n, m = len(self._g), len(g)
+        if n + m > len(self._g_buf):                  # grow 2× when full
+            cap = max(n + m, 2 * len(self._g_buf))
+            xb = np.empty((cap, 4), np.float32); xb[:n] = self._xyzc
+            gb = np.empty(cap, np.uint8);        gb[:n] = self._g
+            self._xyzc_buf, self._g_buf = xb, gb
+        self._xyzc_buf[n:n + m] = xyzc
+        self._g_buf[n:n + m]    = g
+        self._xyzc, self._g = self._xyzc_buf[:n + m], self._g_buf[:n + m]
+        self._n_poses = n + m
+        self.prog.setMaximum(n + m)
+
+    def _loaded(self):
+        self._loading = False
+
+    def _stop_loader(self):
+        self._loader.requestInterruption()
+        self._loader.wait()
+
+    def closeEvent(self, ev):
+        self._stop_loader()          # a replaced dock stops parsing its file
+        super().closeEvent(ev)
+
     # ----------------------------------------------------------------
     # Camera helper
     # ----------------------------------------------------------------
@@ -189,7 +378,7 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         self.speed_slider.setFixedWidth(100)
 
         self.prog = QtWidgets.QSlider(QtCore.Qt.Horizontal)
-        self.prog.setRange(0, len(self._poses_all)); self.prog.setValue(0)
+        self.prog.setRange(0, self._n_poses); self.prog.setValue(0)
         self.prog.sliderPressed.connect(self._pause_for_seek)
         self.prog.sliderReleased.connect(self._seek_here)
 
@@ -213,33 +402,67 @@ class GCodeSimDock(QtWidgets.QDockWidget):
     # Scene‑state helpers
     # ----------------------------------------------------------------
     def _reset_scene(self):
-        # remove frozen chunks
-        for item in self._frozen_items:
-            self.view.removeItem(item)
-        self._frozen_items.clear()
+        # drop frozen chunks
+        self.nf0 = self.nf1 = 0
+        self.frozen_path_g0.setData(pos=np.empty((0, 3), np.float32))
+        self.frozen_path_g1.setData(pos=np.empty((0, 3), np.float32))
 
         # clear tails + visuals
-        self.tail_g0.clear(); self.tail_g1.clear()
-        self.path_g0.setData(pos=np.empty((0, 3)))
-        self.path_g1.setData(pos=np.empty((0, 3)))
+        self.n0 = self.n1 = 0
+        self.dirty0 = self.dirty1 = False
+        self.path_g0.setData(pos=np.empty((0, 3), np.float32))
+        self.path_g1.setData(pos=np.empty((0, 3), np.float32))
 
-        # clear full history refs
-        self.verts_g0.clear(); self.verts_g1.clear()
         self._cursor = 0; self._prev_g = None
 
         # blade to home; UI reset
         self._kin.apply(0, 0, 0, 0)
-        self.prog.blockSignals(True); self.prog.setValue(0); self.prog.blockSignals(False)
+        with QtCore.QSignalBlocker(self.prog):
+            self.prog.setValue(0)
+
+    def _path_rows(self, g_code, t0, t1):
+        """Rows _process_pose records for *g_code* over poses [t0, t1).
+
+        A pose of that move type adds its vertex; the first pose after a run
+        of them adds a NaN break instead – also when the run ended at t0 - 1.
+        """
+        lo   = max(t0 - 1, 0)
+        mine = self._g[lo:t1] == g_code
+        sel  = mine.copy(); sel[1:] |= mine[:-1]
+        sel[0] &= lo == t0                    # pose t0 - 1 is recorded already
+        rows = self._xyzc[lo:t1, :3][sel].astype(float) * SCALE_MM
+        rows[~mine[sel]] = np.nan
+        return rows
 
     def _rebuild_to_cursor(self):
         tgt = self._cursor
         self._reset_scene()
-        self._cursor = 0
-        for i in range(tgt):
-            self._process_pose(self._poses_all[i], record=True, autoupdate=False)
-            self._cursor += 1
-        self._update_paths()
-        self.prog.blockSignals(True); self.prog.setValue(tgt); self.prog.blockSignals(False)
+        self._advance_to(tgt)
+
+    def _advance_to(self, tgt):
+        # poses from the cursor up to tgt in one NumPy pass, appended to the
+        # frozen paths as one chunk – no per-pose replay
+        cur = self._cursor
+        if tgt > cur:
+            self._freeze_tail(0); self._freeze_tail(1)
+            for code in (0, 1):
+                rows = self._path_rows(code, cur, tgt)
+                if not len(rows):
+                    continue
+                if code == 0:
+                    self.frozen_g0, self.nf0 = self._append_chunk(
+                        self.frozen_g0, self.nf0, rows)
+                    self.frozen_path_g0.setData(pos=self.frozen_g0[:self.nf0])
+                else:
+                    self.frozen_g1, self.nf1 = self._append_chunk(
+                        self.frozen_g1, self.nf1, rows)
+                    self.frozen_path_g1.setData(pos=self.frozen_g1[:self.nf1])
+
+            self._kin.apply_pose(self._xyzc, tgt - 1)
+            self._prev_g = int(self._g[tgt - 1])
+        self._cursor = tgt
+        with QtCore.QSignalBlocker(self.prog):
+            self.prog.setValue(tgt)
 
     # ----------------------------------------------------------------
     # Playback controls
@@ -262,8 +485,11 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         if self._running: self._toggle_play()
 
     def _seek_here(self):
-        self._cursor = self.prog.value()
-        self._rebuild_to_cursor()
+        tgt = self.prog.value()
+        if tgt >= self._cursor:
+            self._advance_to(tgt)             # forward: only the poses between
+        else:
+            self._cursor = tgt; self._rebuild_to_cursor()
         if getattr(self, "_was_running", False):
             self._toggle_play()
 
@@ -272,55 +498,82 @@ class GCodeSimDock(QtWidgets.QDockWidget):
     # ----------------------------------------------------------------
     def _tick(self):
         step = max(1, self.speed_slider.value() // 3)
+        end, start = self._n_poses, self._cursor
         for _ in range(step):
-            if self._cursor >= len(self._poses_all):
-                self._toggle_play(); return
-            pose = self._poses_all[self._cursor]; self._cursor += 1
-            self._process_pose(pose, record=True)
-        self._update_paths()
-        self.prog.blockSignals(True); self.prog.setValue(self._cursor); self.prog.blockSignals(False)
+            if self._cursor >= end:               # end of the poses parsed so far
+                break
+            self._process_pose(self._cursor, record=True, autoupdate=False)
+            self._cursor += 1
+        self._update_paths()                      # one upload per frame
+        if self._cursor != start:                 # waiting on the parser: slider stays put
+            with QtCore.QSignalBlocker(self.prog):
+                self.prog.setValue(self._cursor)
+        if not self._loading and self._cursor >= end:
+            self._toggle_play()                   # finished: stop after the last upload
 
     # ----------------------------------------------------------------
     #  Path‑building helpers
     # ----------------------------------------------------------------
+    @staticmethod
+    def _append_chunk(buf, n, rows):
+        """Append *rows* after ``buf[:n]`` (NaN-separated); returns (buf, n).
+
+        Capacity doubles when full, so freezing stays amortised O(chunk).
+        """
+        start = n + 1 if n else 0
+        need  = start + len(rows)
+        if need > len(buf):
+            grown = np.empty((max(need, 2 * len(buf)), 3), np.float32)
+            grown[:n] = buf[:n]; buf = grown
+        if n:
+            buf[n] = np.nan
+        buf[start:need] = rows
+        return buf, need
+
     def _freeze_tail(self, g_code):
-        if g_code == 0 and self.tail_g0:
-            item = GLLinePlotItem(pos=np.asarray(self.tail_g0, float),
-                                  width=1.5, antialias=True,
-                                  color=(0.3, 0.3, 0.3, 0.6))
-            self.view.addItem(item); self._frozen_items.append(item)
-            self.tail_g0.clear(); self.path_g0.setData(pos=np.empty((0, 3)))
-        elif g_code == 1 and self.tail_g1:
-            item = GLLinePlotItem(pos=np.asarray(self.tail_g1, float),
-                                  width=2.0, antialias=True,
-                                  color=(1.0, 1.0, 0.0, 1.0))
-            self.view.addItem(item); self._frozen_items.append(item)
-            self.tail_g1.clear(); self.path_g1.setData(pos=np.empty((0, 3)))
-
-    def _process_pose(self, a, record=False, autoupdate=True):
+        # move the tail into the frozen buffer; one item, one draw call
+        if g_code == 0 and self.n0:
+            self.frozen_g0, self.nf0 = self._append_chunk(
+                self.frozen_g0, self.nf0, self.tail_g0[:self.n0])
+            self.frozen_path_g0.setData(pos=self.frozen_g0[:self.nf0])
+            self.n0 = 0; self.path_g0.setData(pos=np.empty((0, 3), np.float32))
+        elif g_code == 1 and self.n1:
+            self.frozen_g1, self.nf1 = self._append_chunk(
+                self.frozen_g1, self.nf1, self.tail_g1[:self.n1])
+            self.frozen_path_g1.setData(pos=self.frozen_g1[:self.nf1])
+            self.n1 = 0; self.path_g1.setData(pos=np.empty((0, 3), np.float32))
+
+    def _process_pose(self, i, record=False, autoupdate=True):
         # move blade
-        self._kin.apply(a["X"], a["Y"], a["Z"], a["C"])
+        x, y, z, _ = self._xyzc[i].tolist()
+        g = int(self._g[i])
+        self._kin.apply_pose(self._xyzc, i)
 
         # record path points
         if record:
-            v = [a["X"]*SCALE_MM, a["Y"]*SCALE_MM, a["Z"]*SCALE_MM]
-            if a["G"] == 0:
+            v = [x*SCALE_MM, y*SCALE_MM, z*SCALE_MM]
+            if g == 0:
                 if self._prev_g == 1:
-                    self.tail_g1.append([np.nan]*3); self.verts_g1.append([np.nan]*3)
-                self.tail_g0.append(v); self.verts_g0.append(v)
-                if len(self.tail_g0) >= self.CHUNK_SIZE: self._freeze_tail(0)
+                    self.tail_g1[self.n1] = np.nan; self.n1 += 1
+                self.tail_g0[self.n0] = v; self.n0 += 1
+                self.dirty0 = True
+                if self.n0 >= self.CHUNK_SIZE: self._freeze_tail(0)
             else:  # cutting move
                 if self._prev_g == 0:
-                    self.tail_g0.append([np.nan]*3); self.verts_g0.append([np.nan]*3)
-                self.tail_g1.append(v); self.verts_g1.append(v)
-                if len(self.tail_g1) >= self.CHUNK_SIZE: self._freeze_tail(1)
-            self._prev_g = a["G"]
+                    self.tail_g0[self.n0] = np.nan; self.n0 += 1
+                self.tail_g1[self.n1] = v; self.n1 += 1
+                self.dirty1 = True
+                if self.n1 >= self.CHUNK_SIZE: self._freeze_tail(1)
+            self._prev_g = g
 
         if autoupdate:
             self._update_paths()
 
     def _update_paths(self):
-        if self.tail_g0:
-            self.path_g0.setData(pos=np.asarray(self.tail_g0))
-        if self.tail_g1:
-            self.path_g1.setData(pos=np.asarray(self.tail_g1))
+        # views into the tail buffers: no per-frame list → array copy;
+        # only a tail that grew since the last call is re-uploaded
+        if self.dirty0 and self.n0:
+            self.path_g0.setData(pos=self.tail_g0[:self.n0])
+        if self.dirty1 and self.n1:
+            self.path_g1.setData(pos=self.tail_g1[:self.n1])
+        self.dirty0 = self.dirty1 = False
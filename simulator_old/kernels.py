@@ -0,0 +1,49 @@
+# ===============================
+# file: kernels.py
+# ===============================
+"""Per-pose path decimation for :mod:`simulator_old.viewer`.
+
+numba is optional: without it ``segment_decision`` is the same function run
+by the interpreter – still plain float math, no NumPy calls per pose.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:          # pragma: no cover - optional dependency
+    njit = None
+
+# (prev xyz, cur xyz, last unit dir xyz, has_dir, accum, step_mm, min_cos)
+#   -> (store, unit dir xyz, has_dir, accum)
+_SIGNATURE = "Tuple((b1, f8, f8, f8, b1, f8))(" + ", ".join(
+    ["f8"] * 9 + ["b1"] + ["f8"] * 3) + ")"
+
+
+def _segment_decision(px, py, pz, x, y, z, ldx, ldy, ldz, has_dir,
+                      accum, step_mm, min_cos):
+    """
+    Keep the pose at (x, y, z)? It is kept once *step_mm* of travel has
+    built up since the last kept one, or when the path turns: the cosine
+    between this and the last direction drops below *min_cos* (arccos is
+    monotone, so no angle is computed). Returns the new unit direction and
+    the updated distance accumulator with the decision; a zero-length step
+    has no direction (the next turn test is skipped).
+    """
+    dx, dy, dz = x - px, y - py, z - pz
+    seg = math.sqrt(dx * dx + dy * dy + dz * dz)
+    turned = False
+    if seg > 0.0:
+        dx, dy, dz = dx / seg, dy / seg, dz / seg
+        if has_dir:
+            turned = dx * ldx + dy * ldy + dz * ldz < min_cos
+    accum += seg
+    store = accum >= step_mm or turned
+    if store:
+        accum = 0.0
+    return store, dx, dy, dz, seg > 0.0, accum
+
+
+if njit is not None:
+    segment_decision = njit(_SIGNATURE, cache=True)(_segment_decision)
+else:
+    segment_decision = _segment_decision
@@ -62,8 +62,8 @@ def _disc_mesh(radius: float, half_t: float, sectors: int = 64) -> MeshData:
         d = i_bot_ring + (i + 1) % sectors
         faces.extend([[a, b, d], [a, d, c]])
 
-    faces = np.array(faces, dtype=int)
-    return MeshData(vertexes=vertices, faces=faces)
+    faces = np.array(faces, dtype=np.uint32)
+    return MeshData(vertexes=vertices.astype(np.float32), faces=faces)
 
 
 def make_blade(radius_mm: float = 200.0,
@@ -2,52 +2,90 @@
 # file: parser.py
 # ===============================
 from typing import Iterator, Dict, Tuple, List
-import re, math
+from itertools import chain
+import re
+
+import numpy as np
 
 STEP_MM = 5.0                          # segment length for interpolation
 _EXPR   = re.compile(r'([A-Z])([-+]?\d*\.?\d+)')
 
-def _parse(line: str) -> Dict[str, float]:
-    return {m[0]: float(m[1]) for m in _EXPR.findall(line.upper())}
+def _interp(p0: np.ndarray, p1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Interpolate every segment p0[i] → p1[i] (both ``(m, 3)``) in one pass.
+    Returns ``(points, seg)``: points every ~STEP_MM along each segment
+    (start exclusive, end inclusive) and the segment each point belongs to.
+    Zero-length segments contribute no points.
+    """
+    d      = p1 - p0
+    length = np.sqrt((d * d).sum(axis=1))
+    n      = np.where(length > 0, np.maximum(1, (length / STEP_MM).astype(int)), 0)
+    seg    = np.repeat(np.arange(len(n)), n)
+    first  = np.cumsum(n) - n                          # index of each segment's 1st point
+    t      = (np.arange(len(seg)) - first[seg] + 1) / n[seg]
+    return p0[seg] + t[:, None] * d[seg], seg
 
-def _interp(p0: Tuple[float, float, float],
-            p1: Tuple[float, float, float]) -> List[Tuple[float, float, float]]:
-    dx, dy, dz = (p1[i] - p0[i] for i in range(3))
-    length = math.hypot(math.hypot(dx, dy), dz)
-    if length == 0:
-        return []
-    n = max(1, int(length / STEP_MM))
-    return [(p0[0] + dx * i / n,
-             p0[1] + dy * i / n,
-             p0[2] + dz * i / n) for i in range(1, n + 1)]
+def _poses(rows: List[Tuple[float, ...]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Interpolated ``(xyz, c, g)`` arrays for ``(x0,y0,z0,x,y,z,c,g)`` rows."""
+    if not rows:
+        return np.empty((0, 3)), np.empty(0), np.empty(0, np.uint8)
+    m = np.fromiter(chain.from_iterable(rows), float,
+                    count=8 * len(rows)).reshape(-1, 8)
+    pts, seg = _interp(m[:, 0:3], m[:, 3:6])
+    return pts, m[seg, 6], m[seg, 7].astype(np.uint8)
 
-def pose_stream(path: str) -> Iterator[Dict[str, float]]:
+def pose_chunks(path: str, batch: int = 100_000) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
     """
-    Yields dicts  {"X":..,"Y":..,"Z":..,"C":..,"G":0|1}
-    Handles modal G-codes: a G word is sticky until another appears.
-    Only G0 and G1 moves are emitted.
+    Same poses as :func:`pose_arrays`, yielded as ``(xyz, c, g)`` every
+    *batch* source lines so a caller can start on the first part of a big
+    file. Modal state carries over between chunks; a chunk may be empty.
     """
-    modal = {"X": 0.0, "Y": 0.0, "Z": 0.0, "C": 0.0, "G": 1}   # default to G1
+    # modal state lives in locals; each move is one (start, end, C, G) row
+    x = y = z = c = 0.0
+    g = 1                                                   # default to G1
+    rows: List[Tuple[float, ...]] = []
+    words = _EXPR.findall
     with open(path) as fh:
-        for raw in fh:
+        for n, raw in enumerate(fh, 1):
+            if n % batch == 0:
+                yield _poses(rows); rows = []
+
             raw = raw.partition(";")[0].strip()
             if not raw:
                 continue
-            words = _parse(raw)
 
-            start = (modal["X"], modal["Y"], modal["Z"])
+            x0, y0, z0 = x, y, z
+            for k, v in words(raw.upper()):
+                if   k == "X": x = float(v)
+                elif k == "Y": y = float(v)
+                elif k == "Z": z = float(v)
+                elif k == "C": c = float(v)
+                elif k == "G": g = int(float(v))
 
-            # update modal state -----------------------------
-            if "G" in words:
-                modal["G"] = int(words["G"])
-            for k in "XYZC":
-                if k in words:
-                    modal[k] = words[k]
+            if g == 0 or g == 1:                            # ignore G2/3 for now
+                rows.append((x0, y0, z0, x, y, z, c, g))
+    yield _poses(rows)
 
-            if modal["G"] not in (0, 1):
-                continue                                    # ignore G2/3 for now
+def pose_arrays(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The poses of :func:`pose_stream` as parallel arrays, with no dict per
+    pose: ``xyz`` (N, 3) mm, ``c`` (N,) degrees (both float64) and ``g``
+    (N,) uint8, 0 | 1.
+    """
+    chunks = list(pose_chunks(path))
+    if len(chunks) == 1:
+        return chunks[0]
+    return tuple(np.concatenate(col) for col in zip(*chunks))
 
-            end = (modal["X"], modal["Y"], modal["Z"])
-            for x, y, z in _interp(start, end):
-                yield {"X": x, "Y": y, "Z": z,
-                       "C": modal["C"], "G": modal["G"]}
+def pose_stream(path: str) -> Iterator[Dict[str, float]]:
+    """
+    Yields dicts  {"X":..,"Y":..,"Z":..,"C":..,"G":0|1}
+    Handles modal G-codes: a G word is sticky until another appears.
+    Only G0 and G1 moves are emitted.
+    Moves are interpolated a chunk at a time (:func:`pose_chunks`), so the
+    first dict comes without reading the whole file.
+    """
+    for xyz, cs, gs in pose_chunks(path):
+        # flat per-column lists: no (N, 3) nest of small lists to allocate
+        for x, y, z, c, g in zip(*xyz.T.tolist(), cs.tolist(), gs.tolist()):
+            yield {"X": x, "Y": y, "Z": z, "C": c, "G": g}
@@ -1,45 +1,181 @@
 # ===============================
 # file: viewer.py
 # ===============================
+import math
+import time
 from PyQt5 import QtCore, QtWidgets, QtGui
 import numpy as np
+from OpenGL import GL
 from pyqtgraph.opengl import (
     GLViewWidget, GLLinePlotItem, GLMeshItem, MeshData
 )
+from pyqtgraph.opengl.GLGraphicsItem import GLGraphicsItem, GLOptions
 
-from .parser     import pose_stream
+from .parser     import pose_chunks
 from .machine    import make_blade
 from .kinematics import Blade4X, SCALE_MM
+from .kernels    import segment_decision
 
 RUNTIME_STEP_MM  = 1.0   # blade moves this far each internal step
 STORE_EVERY_N    = 5     # keep only every 5th vertex in the poly‑line
 DISPLAY_STEP_MM   = 5.0   # store every 5 mm of travel
 ANGLE_THRESH_DEG  = 8.0
+ANGLE_THRESH_COS  = math.cos(math.radians(ANGLE_THRESH_DEG))   # turn ⇔ cos below
+RUN_MAX           = 1000  # vertices per run item; a longer run goes on in the next
+FRAME_BUDGET_MS   = 12.0  # a tick slower than this skips the next upload…
+MAX_SKIPPED_TICKS = 3     # …but never more than this many in a row
+_EMPTY3           = np.empty((0, 3), np.float32)
+_RUN_STYLE        = (dict(width=1.5, antialias=True, color=(0.3, 0.3, 0.3, 0.6)),
+                     dict(width=2.0, antialias=True, color=(1.0, 1.0, 0.0, 1.0)))
+
+
+def _replay(xyz: np.ndarray, state=None):
+    """
+    Which of the poses ``xyz`` (M, 3) mm recording keeps as vertices,
+    without the per-pose calls. Returns ``(keep, accum_dist, last_dir)``;
+    *keep* indexes ``xyz``.
+
+    Without *state* the scene starts out reset. With *state*
+    ``(last_xyz_mm, last_dir, accum_dist)`` it continues a scene that
+    already holds vertices.
+
+    Lengths and turn angles come from one NumPy pass, written out per
+    component like :func:`segment_decision` so both round alike; only the
+    distance-since-last-vertex recurrence (reset by every stored vertex)
+    is a loop, over plain floats.
+    """
+    if state is not None:                # anchor on the last recorded pose
+        last_xyz, last_dir, accum = state
+        xyz = np.vstack((last_xyz, xyz))
+    d    = np.diff(xyz, axis=0)
+    dx, dy, dz = d.T
+    seg  = np.sqrt(dx * dx + dy * dy + dz * dz)
+    dirs = d / np.where(seg > 0, seg, 1.0)[:, None]
+    ux, uy, uz = dirs.T
+    cos  = ux[1:] * ux[:-1] + uy[1:] * uy[:-1] + uz[1:] * uz[:-1]
+    turned = cos < ANGLE_THRESH_COS
+    turned[(seg[1:] == 0) | (seg[:-1] == 0)] = False   # no direction: no turn
+
+    first = False                                # turn into the first step?
+    if state is None:
+        accum = 0.0
+    elif last_dir is not None and len(seg) and seg[0] > 0:
+        first = bool(ux[0] * last_dir[0] + uy[0] * last_dir[1]
+                     + uz[0] * last_dir[2] < ANGLE_THRESH_COS)
+
+    keep  = [0]                # first point always (or the anchor)
+    for k, (l, t) in enumerate(zip(seg.tolist(), [first] + turned.tolist()), 1):
+        accum += l
+        if accum >= DISPLAY_STEP_MM or t:
+            keep.append(k); accum = 0.0
+
+    keep = np.asarray(keep)
+    if state is not None:
+        keep = keep[1:] - 1    # the anchor is recorded already
+    last_dir = tuple(dirs[-1].tolist()) if len(seg) and seg[-1] > 0 else None
+    return keep, accum, last_dir
+
+# ────────────────────────────────────────────────────────────────────
+# Run line item – vertices kept in a VBO, only new rows uploaded
+# ────────────────────────────────────────────────────────────────────
+# pyqtgraph releases that draw with their own shaders + MVP uniform have
+# no fixed‑function matrices for us to draw under; those keep stock paint
+_LEGACY_GL = not hasattr(GLGraphicsItem, "mvpMatrix")
+
+
+class GrowingLinePlotItem(GLLinePlotItem):
+    """Line strip that only grows, or restarts from empty.
+
+    Stock GLLinePlotItem hands its whole array to GL on every paint. Here
+    the rows live in one VBO of *capacity* vertices and a paint uploads just
+    those added since the last one (glBufferSubData). Callers must not
+    change rows they have already passed to setData, except by clearing.
+    """
+
+    def __init__(self, capacity: int, **kw):
+        self._cap  = capacity
+        self._vbo  = None
+        self._sent = 0                # rows already in the VBO
+        self._rows = None
+        super().__init__(**kw)
+
+    def setData(self, **kw):
+        pos = kw.get("pos")
+        if pos is not None:
+            self._rows = pos
+            if len(pos) < self._sent:
+                self._sent = 0        # cleared: refill from the top
+        super().setData(**kw)
+
+    def paint(self):
+        rows = self._rows
+        if (not _LEGACY_GL or rows is None or len(rows) > self._cap
+                or not isinstance(self.color, tuple)):
+            return super().paint()
+        n = len(rows)
+        if not n:
+            return
+        self.setupGLState()
+
+        if self._vbo is None:
+            self._vbo = GL.glGenBuffers(1)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, self._cap * 12, None,
+                            GL.GL_DYNAMIC_DRAW)
+            self._sent = 0
+        else:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+        if n > self._sent:
+            new = np.ascontiguousarray(rows[self._sent:n], np.float32)
+            GL.glBufferSubData(GL.GL_ARRAY_BUFFER, self._sent * 12,
+                               new.nbytes, new)
+            self._sent = n
+
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        try:
+            GL.glVertexPointer(3, GL.GL_FLOAT, 0, None)
+            GL.glColor4f(*self.color)
+            GL.glLineWidth(self.width)
+            if self.antialias:
+                GL.glEnable(GL.GL_LINE_SMOOTH)
+                GL.glEnable(GL.GL_BLEND)
+                GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+                GL.glHint(GL.GL_LINE_SMOOTH_HINT, GL.GL_NICEST)
+            GL.glDrawArrays(GL.GL_LINE_STRIP, 0, n)
+        finally:
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
 
 # ────────────────────────────────────────────────────────────────────
 # Geometry helper ─ stock slab drawn double-sided
 # ────────────────────────────────────────────────────────────────────
+# translucent, and both windings rasterised – one copy of each face is enough
+_TWO_SIDED = {**GLOptions['translucent'], GL.GL_CULL_FACE: False}
+
+# two triangles per quad, each face once; GL draws both sides
+_BOX_FACES = np.array([
+    [0, 1, 2], [0, 2, 3], [1, 5, 6], [1, 6, 2], [5, 4, 7], [5, 7, 6],
+    [4, 0, 3], [4, 3, 7], [3, 2, 6], [3, 6, 7], [4, 5, 1], [4, 1, 0],
+], np.uint32)
+_BOX_MESHES: dict = {}      # size bytes -> MeshData, shared by every dock
+
+
 def make_double_sided_box(size: np.ndarray,
                           rgba=(0.2, 0.6, 1.0, 0.25)) -> GLMeshItem:
-    """Return a cube mesh whose faces are duplicated back-to-front."""
-    x, y, z = size / 2.0
-    v = np.array([
-        [-x, -y,  z], [ x, -y,  z], [ x,  y,  z], [-x,  y,  z],
-        [-x, -y, -z], [ x, -y, -z], [ x,  y, -z], [-x,  y, -z],
-    ])
-    quads = [
-        [0, 1, 2, 3], [1, 5, 6, 2], [5, 4, 7, 6],
-        [4, 0, 3, 7], [3, 2, 6, 7], [4, 5, 1, 0],
-    ]
-    faces = []
-    for q in quads:
-        faces += [[q[0], q[1], q[2]], [q[0], q[2], q[3]]]   # front
-        faces += [[q[2], q[1], q[0]], [q[3], q[2], q[0]]]   # back
-    md = MeshData(vertexes=v.astype(float),
-                  faces=np.asarray(faces, int))
+    """Return a cube mesh drawn from both sides (back faces not culled)."""
+    key = np.asarray(size, float).tobytes()
+    md = _BOX_MESHES.get(key)
+    if md is None:                    # geometry only; colour is per item
+        x, y, z = size / 2.0
+        v = np.array([
+            [-x, -y,  z], [ x, -y,  z], [ x,  y,  z], [-x,  y,  z],
+            [-x, -y, -z], [ x, -y, -z], [ x,  y, -z], [-x,  y, -z],
+        ], np.float32)
+        md = _BOX_MESHES[key] = MeshData(vertexes=v, faces=_BOX_FACES)
     return GLMeshItem(meshdata=md, smooth=False,
                       drawFaces=True, drawEdges=False,
-                      color=rgba, glOptions='translucent')
+                      color=rgba, glOptions=_TWO_SIDED)
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -54,6 +190,8 @@ class SmoothGLView(GLViewWidget):
         super().__init__(*a, **kw)
         self._last_orbit = None
         self._last_pan   = None
+        self._basis_stamp = None      # (azimuth, elevation) of _basis
+        self._basis       = None      # screen right / up, world coords
 
     def mousePressEvent(self, ev):
         if ev.button() == QtCore.Qt.LeftButton:
@@ -83,19 +221,53 @@ class SmoothGLView(GLViewWidget):
             self._last_pan = None
         super().mouseReleaseEvent(ev)
 
+    def _screen_basis(self):
+        """(right, up) unit vectors of the view plane; cached per camera angle.
+
+        right = (sin az, −cos az, 0) and up = (−sin el·cos az, −sin el·sin az,
+        cos el): ẑ × fwd and fwd × right, folded to closed form.
+        """
+        stamp = (self.opts['azimuth'], self.opts['elevation'])
+        if stamp != self._basis_stamp:
+            az, el = math.radians(stamp[0]), math.radians(stamp[1])
+            sa, ca, se, ce = math.sin(az), math.cos(az), math.sin(el), math.cos(el)
+            self._basis = ((sa, -ca, 0.0), (-se*ca, -se*sa, ce))
+            self._basis_stamp = stamp
+        return self._basis
+
     def _pan_screen(self, dx_px: float, dy_px: float):
-        az  = np.deg2rad(self.opts['azimuth'])
-        el  = np.deg2rad(self.opts['elevation'])
-        fwd = np.array([-np.cos(el)*np.cos(az),
-                        -np.cos(el)*np.sin(az),
-                        -np.sin(el)])
-        right = np.cross([0, 0, 1], fwd); right /= np.linalg.norm(right)
-        upvec = np.cross(fwd, right);     upvec /= np.linalg.norm(upvec)
-        move = (dx_px*right + dy_px*upvec) * self.opts['distance'] * self.PAN_SENS
-        self.opts['center'] += QtGui.QVector3D(*move)
+        (rx, ry, rz), (ux, uy, uz) = self._screen_basis()
+        k = self.opts['distance'] * self.PAN_SENS
+        a, b = dx_px * k, dy_px * k
+        self.opts['center'] += QtGui.QVector3D(a*rx + b*ux, a*ry + b*uy, a*rz + b*uz)
         self.update()
 
 
+# ────────────────────────────────────────────────────────────────────
+#  Background parse – poses reach the dock in batches
+# ────────────────────────────────────────────────────────────────────
+class PoseLoader(QtCore.QThread):
+    chunkReady = QtCore.pyqtSignal(np.ndarray, np.ndarray, np.ndarray)  # xyz, c, g
+    BATCH = 4096                      # poses per signal
+
+    def __init__(self, nc_path: str, parent=None):
+        super().__init__(parent)
+        self._path = nc_path
+
+    def run(self):
+        # each parsed chunk goes out as soon as it is interpolated; a stop
+        # request is seen between chunks, not only after the whole file
+        for xyz, c, g in pose_chunks(self._path):
+            c = c.astype(np.float32)
+            for i in range(0, len(g), self.BATCH):
+                if self.isInterruptionRequested():
+                    return
+                j = i + self.BATCH
+                self.chunkReady.emit(xyz[i:j], c[i:j], g[i:j])
+            if self.isInterruptionRequested():
+                return
+
+
 # ────────────────────────────────────────────────────────────────────
 #  Dock widget simulator
 # ────────────────────────────────────────────────────────────────────
@@ -107,8 +279,15 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         self.nc_path = nc_path
         self._store_skip = 0
 
-        # preload program for progress slider
-        self._poses_all = list(pose_stream(nc_path))
+        # program as SoA columns, row = pose; filled by the loader, and
+        # _XYZ (N, 3) mm / _S (N, 3) scene units, float32 / _C / _G view
+        # the part parsed so far
+        self._XYZ_buf = np.empty((0, 3))
+        self._S_buf   = np.empty((0, 3), np.float32)
+        self._C_buf   = np.empty(0, np.float32)
+        self._G_buf   = np.empty(0, np.uint8)
+        self._XYZ, self._S = self._XYZ_buf, self._S_buf
+        self._C, self._G   = self._C_buf, self._G_buf
         self._cursor    = 0
 
         # ---------- GL scene -----------------------------------------
@@ -121,12 +300,14 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         slab.translate(*(self.box_sz/2 * [1,1,-1]))
         self.view.addItem(slab)
 
-        self.verts_g0, self.verts_g1 = [], []
-        self.path_g0 = GLLinePlotItem(width=1.5, antialias=True,
-                                      color=(0.3,0.3,0.3,0.6))
-        self.path_g1 = GLLinePlotItem(width=2.0, antialias=True,
-                                      color=(1.0,1.0,0.0,1.0))
-        self.view.addItem(self.path_g0); self.view.addItem(self.path_g1)
+        # tool path: one line item per run of same-G moves. Only the last
+        # (open) run changes; its vertices (scene units) fill _run_buf up to
+        # _run_n, and a closed run keeps a copy and is never re-sent
+        self._runs  = []                    # items in use, in path order
+        self._spare = []                    # emptied items (and VBOs) to reuse
+        self._run_buf   = np.empty((RUN_MAX, 3), np.float32)
+        self._run_n     = 0
+        self._run_dirty = False             # open run grew since the upload
 
         # ---------- controls bar -------------------------------------
         self._build_controls()
@@ -144,6 +325,8 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         self._last_dir   = None         # previous segment direction (unit vector)
         self._timer    = QtCore.QTimer(self); self._timer.timeout.connect(self._tick)
         self._running  = False
+        self._last_tick_ms = 0.0        # wall time of the previous tick
+        self._skipped      = 0          # uploads skipped since the last one
 
         QtCore.QTimer.singleShot(0, self._set_start_camera)
         self._reset_scene()
@@ -158,6 +341,46 @@ class GCodeSimDock(QtWidgets.QDockWidget):
             activated=lambda: self.speed_slider.setValue(
                 max(self.SPEED_MIN, self.speed_slider.value()-1)))
 
+        # parse off the UI thread; playback may start on the first batch
+        self._loading = True
+        self._loader  = PoseLoader(nc_path, self)
+        self._loader.chunkReady.connect(self._add_poses)
+        self._loader.finished.connect(self._loaded)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._stop_loader)
+        self._loader.start()
+
+    # ----------------------------------------------------------------
+    # Pose loading
+    # ----------------------------------------------------------------
+    def _add_poses(self, xyz, c, g):
+        n, m = len(self._G), len(g)
+        if n + m > len(self._G_buf):                  # grow 2× when full
+            cap = max(n + m, 2 * len(self._G_buf))
+            xb = np.empty((cap, 3));             xb[:n] = self._XYZ
+            sb = np.empty((cap, 3), np.float32); sb[:n] = self._S
+            cb = np.empty(cap, np.float32);      cb[:n] = self._C
+            gb = np.empty(cap, np.uint8);        gb[:n] = self._G
+            self._XYZ_buf, self._S_buf = xb, sb
+            self._C_buf, self._G_buf   = cb, gb
+        self._XYZ_buf[n:n + m] = xyz
+        self._S_buf[n:n + m]   = xyz * SCALE_MM     # scaled once, not per vertex
+        self._C_buf[n:n + m]   = c
+        self._G_buf[n:n + m]   = g
+        self._XYZ, self._S = self._XYZ_buf[:n + m], self._S_buf[:n + m]
+        self._C, self._G   = self._C_buf[:n + m], self._G_buf[:n + m]
+        self.prog.setMaximum(max(1, n + m - 1))
+
+    def _loaded(self):
+        self._loading = False
+
+    def _stop_loader(self):
+        self._loader.requestInterruption()
+        self._loader.wait()
+
+    def closeEvent(self, ev):
+        self._stop_loader()          # a replaced dock stops parsing its file
+        super().closeEvent(ev)
+
     # ----------------------------------------------------------------
     # Build control bar
     # ----------------------------------------------------------------
@@ -190,7 +413,7 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         # progress slider
         h.addSpacing(12); h.addWidget(QtWidgets.QLabel("Progress"))
         self.prog = QtWidgets.QSlider(QtCore.Qt.Horizontal)
-        rng_max   = max(1, len(self._poses_all)-1)
+        rng_max   = max(1, len(self._G)-1)
         self.prog.setRange(0, rng_max)
         self.prog.setTracking(True)
         self.prog.setStyleSheet("""
@@ -219,30 +442,46 @@ class GCodeSimDock(QtWidgets.QDockWidget):
     def _reset_scene(self):
         self._cursor  = 0
         self._prev_g  = None
-        self.verts_g0.clear(); self.verts_g1.clear()
-        self.path_g0.setData(pos=np.empty((0,3)))
-        self.path_g1.setData(pos=np.empty((0,3)))
+        for item in self._runs:
+            item.setData(pos=_EMPTY3)
+        self._spare += self._runs; self._runs = []
+        self._run_n = 0; self._run_dirty = False
         self._kin.apply(0,0,0,0)
-        self.prog.blockSignals(True); self.prog.setValue(0); self.prog.blockSignals(False)
+        with QtCore.QSignalBlocker(self.prog):
+            self.prog.setValue(0)
         self._accum_dist = 0.0
         self._last_dir   = None
-        self._last_xyz_mm = np.array([0.0, 0.0, 0.0])
+        self._last_xyz_mm = (0.0, 0.0, 0.0)
 
     def _rebuild_to_cursor(self):
         """Rebuild blade pose & polylines so they match self._cursor."""
         target = self._cursor              # ❶ remember where the user wants to go
         self._reset_scene()                # this now resets graphics only
-        self._cursor = 0                   # start replay from the beginning
-
-        for i in range(target):            # ❷ fast-forward to target
-            self._process_pose(self._poses_all[i],
-                            record=True, autoupdate=False)
-            self._cursor += 1
+        self._advance_to(target)           # ❷ fast-forward from empty
+
+    def _advance_to(self, target):
+        """Record poses [cursor, target) on top of the scene, vectorised."""
+        cur = self._cursor
+        if target > cur:
+            state = None                   # empty scene: _replay starts fresh
+            if self._runs:
+                state = (self._last_xyz_mm, self._last_dir, self._accum_dist)
+            keep, self._accum_dist, self._last_dir = \
+                _replay(self._XYZ[cur:target], state)
+            vs, gs = self._S[cur + keep], self._G[cur + keep]
+            if len(gs):                    # split where the move type changes
+                cuts = np.flatnonzero(gs[1:] != gs[:-1]) + 1
+                for rows, code in zip(np.split(vs, cuts),
+                                      gs[np.r_[0, cuts]].tolist()):
+                    self._extend_run(rows, code)
+            self._last_xyz_mm = tuple(self._XYZ[target - 1].tolist())
+            self._kin.apply(*self._XYZ[target - 1].tolist(),
+                            float(self._C[target - 1]))
+        self._cursor = target
 
         self._update_polylines()               # ❸ draw
-        self.prog.blockSignals(True)       # keep slider silent
-        self.prog.setValue(target)         # show new position
-        self.prog.blockSignals(False)
+        with QtCore.QSignalBlocker(self.prog):  # keep slider silent
+            self.prog.setValue(target)          # show new position
 
 
     # ----------------------------------------------------------------
@@ -251,6 +490,7 @@ class GCodeSimDock(QtWidgets.QDockWidget):
     def _toggle_play(self):
         if self._running:
             self._timer.stop(); self.play_btn.setText("▶︎"); self._running=False
+            self._update_polylines()            # draw what a skipped tick left
         else:
             self._timer.start(16); self.play_btn.setText("❚❚"); self._running=True
 
@@ -266,75 +506,105 @@ class GCodeSimDock(QtWidgets.QDockWidget):
         if self._running: self._toggle_play()
 
     def _seek_here(self):
-        self._cursor = self.prog.value()
-        self._rebuild_to_cursor()
+        target = min(self.prog.value(), len(self._G))   # may be still parsing
+        if target >= self._cursor:
+            self._advance_to(target)           # forward: only the poses between
+        else:
+            self._cursor = target; self._rebuild_to_cursor()
         if getattr(self, "_was_running", False): self._toggle_play()
 
     # ----------------------------------------------------------------
     # Timer tick
     # ----------------------------------------------------------------
     def _tick(self):
+        t0 = time.perf_counter()
         speed_eff = max(1, self.speed_slider.value() // 3)
-        for _ in range(speed_eff):
-            if self._cursor >= len(self._poses_all):
-                self._toggle_play(); return
-            pose = self._poses_all[self._cursor]; self._cursor += 1
-            self._process_pose(pose, record=True)
-
-        self._update_polylines()
-        self.prog.blockSignals(True); self.prog.setValue(self._cursor); self.prog.blockSignals(False)
+        i0 = self._cursor
+        i1 = min(i0 + speed_eff, len(self._G))
+        if i0 >= i1:
+            if not self._loading:                # the end, not just the parsed part
+                self._toggle_play()
+            return
+        self._batch_advance(i0, i1)
+        self._cursor = i1
+
+        # nothing new stored: no upload; over budget: let the blade move
+        # alone this frame – the buffers stay dirty and the next upload
+        # catches up
+        if self._run_dirty:
+            if (self._last_tick_ms < FRAME_BUDGET_MS
+                    or self._skipped >= MAX_SKIPPED_TICKS):
+                self._update_polylines(); self._skipped = 0
+            else:
+                self._skipped += 1
+        with QtCore.QSignalBlocker(self.prog):
+            self.prog.setValue(self._cursor)
+        self._last_tick_ms = (time.perf_counter() - t0) * 1000.0
+
+    def _batch_advance(self, i0, i1):
+        """Record poses ``i0..i1-1``, then move the blade once, to the last."""
+        for idx in range(i0, i1):                # intermediate poses are never drawn
+            self._record_pose(idx)
+        self._kin.apply(*self._XYZ[i1 - 1].tolist(), float(self._C[i1 - 1]))
 
     # ----------------------------------------------------------------
-    # Helper: process one pose
+    # Helper: record one pose
     # ----------------------------------------------------------------
-    def _process_pose(self, a, record=False, autoupdate=True):
-        # 1) always move the blade
-        self._kin.apply(a["X"], a["Y"], a["Z"], a["C"])
-        if not record:
-            return
+    def _record_pose(self, idx):
+        """Add pose *idx* to the poly-lines if it is kept; True when it was."""
+        v = x, y, z = self._XYZ[idx].tolist()     # mm
 
-        # 2) compute segment information
-        v = np.array([a["X"], a["Y"], a["Z"]], float)
-        if not self.verts_g0 and not self.verts_g1:
+        # keep this pose? criteria: direction change or 5 mm travelled
+        if not self._runs:
             need_store = True                     # first point always
             seg_dir    = None
-            seg_len    = 0.0
         else:
-            prev = np.array(self._last_xyz_mm, float)
-            delta = v - prev
-            seg_len = np.linalg.norm(delta)
-            seg_dir = delta / seg_len if seg_len else None
-
-            # criteria: direction change or 5 mm travelled
-            turn = 0 if self._last_dir is None else np.degrees(
-                    np.arccos(np.clip(np.dot(seg_dir, self._last_dir), -1, 1)))
-            need_store = (self._accum_dist + seg_len >= DISPLAY_STEP_MM) or (
-                        turn > ANGLE_THRESH_DEG)
-
-        # 3) update accumulators
-        self._accum_dist += seg_len
+            ld = self._last_dir
+            need_store, dx, dy, dz, moved, self._accum_dist = segment_decision(
+                *self._last_xyz_mm, x, y, z, *(ld or (0.0, 0.0, 0.0)),
+                ld is not None, self._accum_dist, DISPLAY_STEP_MM, ANGLE_THRESH_COS)
+            seg_dir = (dx, dy, dz) if moved else None
+
+        # update state
         if need_store:
-            self._accum_dist = 0.0
-            self._store_vertex(v, a["G"])
+            self._store_vertex(idx, int(self._G[idx]))
         self._last_xyz_mm = v
         self._last_dir    = seg_dir
-        if autoupdate and need_store:
-            self._update_polylines()
-
-    def _store_vertex(self, v_mm, gcode):
-        v_scene = [v_mm[0]*SCALE_MM, v_mm[1]*SCALE_MM, v_mm[2]*SCALE_MM]
-        if gcode == 0:
-            if self._prev_g == 1:
-                self.verts_g1.append([np.nan]*3)
-            self.verts_g0.append(v_scene)
+        return need_store
+
+    def _open_run(self, gcode):
+        """Close the open run (if any) and start an empty one for *gcode*."""
+        if self._runs:                               # keeps its own rows
+            self._runs[-1].setData(pos=self._run_buf[:self._run_n].copy())
+        if self._spare:
+            item = self._spare.pop(); item.setData(**_RUN_STYLE[gcode])
         else:
-            if self._prev_g == 0:
-                self.verts_g0.append([np.nan]*3)
-            self.verts_g1.append(v_scene)
+            item = GrowingLinePlotItem(RUN_MAX, **_RUN_STYLE[gcode])
+            self.view.addItem(item)
+        self._runs.append(item)
+        self._run_n = 0
+
+    def _extend_run(self, rows, gcode):
+        """Append the (K, 3) scene-unit *rows*, all of move type *gcode*."""
+        if not self._runs or gcode != self._prev_g:
+            self._open_run(gcode)
         self._prev_g = gcode
+        buf = self._run_buf
+        while len(rows):
+            if self._run_n == len(buf):              # full: go on from the last
+                last = buf[-1].copy()                # vertex in a new item
+                self._open_run(gcode)
+                buf[0] = last; self._run_n = 1
+            k = min(len(rows), len(buf) - self._run_n)
+            buf[self._run_n:self._run_n + k] = rows[:k]; self._run_n += k
+            rows = rows[k:]
+        self._run_dirty = True
+
+    def _store_vertex(self, idx, gcode):
+        self._extend_run(self._S[idx:idx + 1], gcode)
 
     def _update_polylines(self):
-        if self.verts_g0:
-            self.path_g0.setData(pos=np.asarray(self.verts_g0))
-        if self.verts_g1:
-            self.path_g1.setData(pos=np.asarray(self.verts_g1))
\ No newline at end of file
+        # only the open run changes; it sends just the rows added since
+        if self._run_dirty and self._runs:
+            self._runs[-1].setData(pos=self._run_buf[:self._run_n])
+        self._run_dirty = False
@@ -1,16 +1,42 @@
 # canvas.py
 from __future__ import annotations
+from contextlib import contextmanager
 from typing import Any, List
 import ezdxf
 from ezdxf.addons.drawing.qtviewer import CADGraphicsView, PyQtBackend
 from ezdxf.addons.drawing import RenderContext, Frontend
 from ezdxf.bbox import extents
-from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer
 from PyQt5.QtGui import QPen, QBrush, QColor, QPainterPath, QPolygonF
-from PyQt5.QtWidgets import QGraphicsView, QGraphicsRectItem, QGraphicsItemGroup
+from PyQt5.QtWidgets import (QGraphicsView, QGraphicsRectItem, QGraphicsItemGroup,
+                             QGraphicsItem)
 from core.config import config
 Point = tuple[float, float]
 
+
+class _RectsItem(QGraphicsItem):
+    """Many rectangles as one scene item, painted with a single drawRects."""
+
+    def __init__(self, rects: list[QRectF], pen: QPen, brush: QBrush):
+        super().__init__()
+        self._rects, self._pen, self._brush = rects, pen, brush
+        bounds = QRectF()
+        for r in rects:
+            bounds |= r
+        # a scene-unit outline straddles the edges; a cosmetic one is a few
+        # device pixels wide, which the view's update margin already covers
+        hw = 0.0 if pen.isCosmetic() else pen.widthF() / 2
+        self._bounds = bounds.adjusted(-hw, -hw, hw, hw)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
+        painter.drawRects(self._rects)
+
+
 class Canvas(CADGraphicsView):
     
     def __init__(self, parent=None):
@@ -32,40 +58,86 @@ class Canvas(CADGraphicsView):
         self._dot_brush = QBrush(QColor("#FFFF00"))
         self._smoothing_poly_item = None
         self._smoothing_item = None 
+        self._dxf_group: QGraphicsItemGroup | None = None   # rendered drawing
+        self._pending_pts = None         # newest path waiting for display_path_idle
+        self._draw_scheduled = False
         self.doc: ezdxf.document.Drawing | None = None
 
     def draw_table(self, length: float, width: float, *, orientation: str):
-        if self._table_item:
-            self.scene().removeItem(self._table_item)
-
         w   = length if orientation == "front" else width
         h   = 50
 
         pen   = QPen(QColor("#CDCDCDFF"), 1); pen.setCosmetic(True)
         brush = QBrush(QColor("#333333"))
-        self._table_item = self.scene().addRect(0, 0, w, -h, pen, brush)
-        self._table_item.setZValue(-100)
+        with self._batched():                     # swap, re-rect, refit: one paint
+            if self._table_item:
+                self.scene().removeItem(self._table_item)
+            self._table_item = self.scene().addRect(0, 0, w, -h, pen, brush)
+            self._table_item.setZValue(-100)
+
+            self.setSceneRect(-600, -500, 4500, 1000)
+            self.fitInView(0, 0, 4000, 500, Qt.KeepAspectRatio)
 
-        self.setSceneRect(-600, -500, 4500, 1000)
-        self.fitInView(0, 0, 4000, 500, Qt.KeepAspectRatio)
+    @contextmanager
+    def _batched(self):
+        """Edit the scene with view updates off; one repaint at the end."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
 
     def load_doc(self, doc: ezdxf.document.Drawing):
         self.doc = doc
         scene = self.scene()
-        Frontend(RenderContext(doc), PyQtBackend(scene)).draw_layout(doc.modelspace())
+        with self._batched():
+            if self._dxf_group is not None:       # replaces the previous drawing
+                scene.removeItem(self._dxf_group)
+            before = set(scene.items())
+            Frontend(RenderContext(doc), PyQtBackend(scene)).draw_layout(doc.modelspace())
+
+            # one parent for every rendered entity: shifting the drawing is a
+            # single moveBy; children still get their own hover / selection
+            self._dxf_group = scene.createItemGroup(
+                [it for it in scene.items() if it not in before])
+            self._dxf_group.setHandlesChildEvents(False)
         # self.fitInView(self.sceneRect(), mode=1)
 
+    def move_doc(self, dx: float) -> None:
+        """Shift the rendered drawing by *dx* along X (scene units = mm)."""
+        if self._dxf_group is not None:
+            self._dxf_group.moveBy(dx, 0)
+
     def show_points(self, pts: list[Point]) -> None:
         DOT_R = 0.2                       # radius in model‑space units
         PEN    = QPen(QColor("#FFFF00"))  # outline
         BRUSH  = QBrush(QColor("#FFFF00"))  # fill
         PEN.setCosmetic(True)             # stays 1‑px on screen
+        if not pts:
+            return
+        # every dot in one path item; winding fill keeps overlapping dots solid
+        path = QPainterPath()
+        path.setFillRule(Qt.WindingFill)
         for x, y in pts:
-            self.scene().addEllipse(
-                QRectF(x - DOT_R, y - DOT_R, 2 * DOT_R, 2 * DOT_R),
-                PEN,
-                BRUSH,
-            )
+            path.addEllipse(QRectF(x - DOT_R, y - DOT_R, 2 * DOT_R, 2 * DOT_R))
+        self._point_items.append(self.scene().addPath(path, PEN, BRUSH))
+
+    def display_path_idle(self, pts):
+        """:meth:`display_path` once control returns to the event loop.
+
+        Calls made before then coalesce: only the newest *pts* is drawn.
+        """
+        self._pending_pts = pts
+        if self._draw_scheduled:
+            return
+        self._draw_scheduled = True
+        QTimer.singleShot(0, self._flush_draw)
+
+    def _flush_draw(self):
+        pts, self._pending_pts = self._pending_pts, None
+        self._draw_scheduled = False
+        self.display_path(pts)
 
     def display_path(self, pts):
         """Draw blade rectangle where (x, y) is bottom‑left corner."""
@@ -79,8 +151,11 @@ class Canvas(CADGraphicsView):
         pen   = self._pass_pen
         brush = self._dot_brush
 
-        for x_left, y in pts:
-            rect = QRectF(x_left, y, blade_w, blade_h)      # bottom‑left anchor
-            item = self.scene().addRect(rect, pen, brush)
-            item.setZValue(10)
-            self._dot_items.append(item)
+        if not pts:
+            return
+        # one item for the whole path: no per-rect item to index and hit-test
+        item = _RectsItem([QRectF(x_left, y, blade_w, blade_h)    # bottom‑left anchor
+                           for x_left, y in pts], pen, brush)
+        item.setZValue(10)
+        self.scene().addItem(item)
+        self._dot_items.append(item)
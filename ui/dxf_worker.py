@@ -0,0 +1,90 @@
+# ui/dxf_worker.py
+from __future__ import annotations
+from collections import OrderedDict
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core import operations
+from dxf.dxf import Dxf
+
+
+# recently read drawings, most recent last; touched on the GUI thread only
+_DXF_CACHE: "OrderedDict[tuple, Dxf]" = OrderedDict()
+_DXF_CACHE_MAX = 4
+
+
+def dxf_key(fn: str) -> tuple:
+    """Cache key for *fn*: a rewritten file gets a new one."""
+    p = Path(fn).resolve()
+    st = p.stat()
+    return str(p), st.st_mtime_ns, st.st_size
+
+
+def cached_dxf(key: tuple) -> Dxf | None:
+    """The drawing read earlier under *key*, moved back to file coordinates."""
+    wrapper = _DXF_CACHE.get(key)
+    if wrapper is not None:
+        _DXF_CACHE.move_to_end(key)
+        if wrapper.x_shift:
+            wrapper.translate_x(-wrapper.x_shift)
+    return wrapper
+
+
+def remember_dxf(key: tuple, wrapper: Dxf) -> None:
+    _DXF_CACHE[key] = wrapper
+    _DXF_CACHE.move_to_end(key)
+    if len(_DXF_CACHE) > _DXF_CACHE_MAX:
+        _DXF_CACHE.popitem(last=False)
+
+
+class DxfWorkerSignals(QObject):
+    """Results of a background job; QRunnable itself cannot emit."""
+    done   = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class DxfLoader(QRunnable):
+    """Read a DXF file on a pool thread and hand back the :class:`Dxf`.
+
+    The signals object is created on the GUI thread, so its slots run
+    there too (queued connection).
+    """
+
+    def __init__(self, fn: str, key: tuple | None = None):
+        super().__init__()
+        self.fn, self.key = fn, key              # key: for remember_dxf
+        self.signals = DxfWorkerSignals()
+
+    def run(self):
+        try:
+            wrapper = Dxf.from_file(self.fn)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(wrapper)
+
+
+class PathBuilder(QRunnable):
+    """Run :func:`core.operations.generate_path` on a pool thread.
+
+    *cfg* should be a snapshot: the settings palette keeps editing the
+    live config while the job runs. *old* is the pass the result
+    replaces (``None`` appends a new process); it is kept by identity,
+    not row, since rows can be moved or deleted while the job runs.
+    """
+
+    def __init__(self, dxf_wrapper: Dxf, cfg: dict, label: str,
+                 old: object | None = None):
+        super().__init__()
+        self.dxf, self.cfg = dxf_wrapper, cfg
+        self.label, self.old = label, old
+        self.signals = DxfWorkerSignals()
+
+    def run(self):
+        try:
+            path = operations.generate_path(self.dxf, self.cfg, self.label)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(path)
@@ -1,15 +1,16 @@
 # main_window.py
+import copy
 import sys
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui  import QIcon
+from PyQt5.QtCore import Qt, QSize, QThreadPool, QTimer, QSettings
+from PyQt5.QtGui  import QIcon, QPixmap
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction,
     QFileDialog, QMessageBox, QToolBar,
-    QListWidgetItem, QDockWidget, QWidget,
+    QDockWidget, QWidget,
     QFormLayout, QDoubleSpinBox, QStackedWidget,
-    QVBoxLayout, QFileDialog
+    QVBoxLayout, QFileDialog, QLabel
 )
 
 from core import probe
@@ -18,12 +19,37 @@ from core.config import config, save_config
 from ui.dialogs import MachineSettingsDialog, ToolSettingsDialog, ToolpathSettingsDialog
 from ui.canvas import Canvas
 from ui.process_manager import ProcessManager, DxfInfo
-from ui.process_list_widget import ProcessListWidget
+from ui.process_list_widget import ProcessListView
+from ui.dxf_worker import DxfLoader, PathBuilder, dxf_key, cached_dxf, remember_dxf
 from dxf.dxf import Dxf
-from simulator.viewer import GCodeSimDock
+
+TOOL_ICON_PX = 50              # toolbar icon edge
+
+# toolbar icons, decoded once per process however many windows are built
+_ICON_CACHE: dict[tuple[str, int], QIcon] = {}
+
+
+def _icon(path: str, size: int = TOOL_ICON_PX) -> QIcon:
+    """*path* as an icon holding pixmaps pre-scaled to *size* (and 2× for
+    high-DPI screens, when the PNG is that big), so painting never
+    rescales the source image."""
+    icon = _ICON_CACHE.get((path, size))
+    if icon is None:
+        src, icon = QPixmap(path), QIcon()
+        # a missing file stays an empty icon, as QIcon(path) did: scaling a
+        # null pixmap would only log warnings
+        edge = 0 if src.isNull() else max(src.width(), src.height())
+        for px in (size, 2 * size):
+            if edge and (px == size or edge >= px):   # never blow a small PNG up
+                icon.addPixmap(src.scaled(px, px, Qt.KeepAspectRatio,
+                                          Qt.SmoothTransformation))
+        _ICON_CACHE[(path, size)] = icon
+    return icon
 
 # ===================================================================== MainWindow
 class MainWindow(QMainWindow):
+    EDIT_DEBOUNCE_MS = 150          # quiet time before a spin edit is applied
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Profile Wizard")
@@ -31,25 +57,64 @@ class MainWindow(QMainWindow):
 
         # ---------- back‑end holders ---------------------------------
         self.proc_mgr     = ProcessManager()
-        self.process_list = ProcessListWidget(self.proc_mgr)
 
         # ---------- UI scaffolding -----------------------------------
         self._side_view = config["machine_settings"].get("table_orientation") == "side"
         self.orientation = config["machine_settings"]["table_orientation"]
         self._dxf_info: DxfInfo | None = None
+        self._dxf_job = None               # DxfLoader in flight
+        self._path_job = None              # PathBuilder in flight
+        self._regen_pending = False
+
+        # spin-box edits arrive in bursts; act once they pause
+        self._regen_timer = QTimer(self); self._regen_timer.setSingleShot(True)
+        self._regen_timer.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._regen_timer.timeout.connect(self._regen_current_process)
+        self._xmin_timer = QTimer(self); self._xmin_timer.setSingleShot(True)
+        self._xmin_timer.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._xmin_timer.timeout.connect(self._apply_xmin)
+
         self._create_menus()
-        self._create_side_panel()      # needs self.process_list
+        self._create_side_panel()      # creates self.process_list
         self._create_top_toolbar()
 
         # ---------- central canvas -----------------------------------
         self.view = Canvas(self)
         self.setCentralWidget(self.view)
 
+        # status text in a plain label: setText schedules a normal repaint
+        self._status_label = QLabel("")
+        self.statusBar().addWidget(self._status_label, 1)
+        self._status_timer = QTimer(self); self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._status_label.clear)
+
         # list‑widget signals that need canvas:
-        self.process_list.itemClicked.connect(self._on_process_clicked)
+        self.process_list.clicked.connect(self._on_process_clicked)
 
         self.sim_dock = None 
 
+        # last session's layout, if there is one
+        settings = QSettings("ProfileWizard", "ProfileWizard")
+        geom, state = settings.value("geometry"), settings.value("state")
+        if geom is not None:
+            self.restoreGeometry(geom)
+        if state is not None:
+            self.restoreState(state)
+
+    def closeEvent(self, ev):
+        settings = QSettings("ProfileWizard", "ProfileWizard")
+        settings.setValue("geometry", self.saveGeometry())
+        settings.setValue("state", self.saveState())
+        super().closeEvent(ev)
+
+    def _show_status(self, text: str, ms: int = 0):
+        """Show *text* in the status bar; cleared after *ms* unless 0."""
+        self._status_label.setText(text)
+        if ms:
+            self._status_timer.start(ms)         # a newer message restarts it
+        else:
+            self._status_timer.stop()
+
     # ---------------------------------------------------------------- menus
     def _create_menus(self):
         file_menu = self.menuBar().addMenu("&File")
@@ -63,15 +128,16 @@ class MainWindow(QMainWindow):
 
     # ---------------------------------------------------------------- toolbar
     def _create_top_toolbar(self):
-        tb = QToolBar("Tools", self); tb.setIconSize(QSize(50, 50))
+        tb = QToolBar("Tools", self); tb.setIconSize(QSize(TOOL_ICON_PX, TOOL_ICON_PX))
+        tb.setObjectName("ToolsToolBar")               # saveState keys on it
         self.addToolBar(Qt.TopToolBarArea, tb)
 
-        self._icon_front = QIcon("ui/icons/front.png")
-        self._icon_side  = QIcon("ui/icons/side.png")
+        self._icon_front = _icon("ui/icons/front.png")
+        self._icon_side  = _icon("ui/icons/side.png")
         side_view = config["machine_settings"].get("table_orientation") == "side"
 
         def act(icon, text, slot=None, sc=None, tip=None):
-            a = QAction(QIcon(icon), text, self)
+            a = QAction(_icon(icon), text, self)
             if sc:  a.setShortcut(sc)
             if tip: a.setToolTip(tip)
             if slot: a.triggered.connect(slot)
@@ -101,8 +167,9 @@ class MainWindow(QMainWindow):
         self.orient_act.triggered.connect(self._toggle_table_orientation)
         tb.addAction(self.orient_act)
 
+        self._import_act = act("ui/icons/importDXF.png", "Import DXF", self.open_dxf, "Ctrl+I")
         tb.addActions([
-            act("ui/icons/importDXF.png", "Import DXF",   self.open_dxf, "Ctrl+I"),
+            self._import_act,
             act("ui/icons/roughing.png",  "Generate Roughing",  self.generate_roughing),
             act("ui/icons/smoothing.png", "Generate Smoothing", self.generate_smoothing),
             act("ui/icons/exportGcode.png", "Export G‑code", self.export_gcode),
@@ -118,7 +185,8 @@ class MainWindow(QMainWindow):
         vbox.setSpacing(0)
 
         # ---------- 1) process list ------------------------------------
-        self.process_list = ProcessListWidget(self.proc_mgr)
+        self.process_list = ProcessListView(self.proc_mgr)
+        self._proc_model  = self.process_list.model()
         vbox.addWidget(self.process_list, 1)  # stretch = 1
 
         # ---------- 2) stacked settings palette ------------------------
@@ -187,12 +255,13 @@ class MainWindow(QMainWindow):
 
         # ---------- dock ------------------------------------------------
         dock = QDockWidget("Process List", self)
+        dock.setObjectName("ProcessListDock")          # saveState keys on it
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setWidget(panel)
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
 
         # ---------- selection change -> palette switch -----------------
-        self.process_list.currentItemChanged.connect(self._palette_on_row_change)
+        self.process_list.selectionModel().currentChanged.connect(self._palette_on_row_change)
 
     def _palette_on_row_change(self, current, previous):
         proc = current.data(Qt.UserRole)
@@ -235,7 +304,7 @@ class MainWindow(QMainWindow):
         def _on_change(v):
             config["toolpath_settings"][key] = float(v)
             if geom_affects:
-                self._regen_current_process()
+                self._regen_timer.start()        # restarts on every step
         box.valueChanged.connect(_on_change)
         return box
 
@@ -251,9 +320,38 @@ class MainWindow(QMainWindow):
         if not fn:
             return
         try:
-            self.dxfWrapper = Dxf.from_file(fn)
-        except Exception as e:
+            key = dxf_key(fn)
+        except OSError as e:
             QMessageBox.critical(self, "DXF Error", str(e)); return
+
+        # the same unchanged file again: no parse. Not while a path job
+        # samples the drawing – resetting its shift would move entities
+        wrapper = cached_dxf(key) if self._path_job is None else None
+        if wrapper is not None:
+            self._on_dxf_loaded(wrapper)
+            return
+
+        # parse on a pool thread; the window keeps painting meanwhile
+        self._import_act.setEnabled(False)
+        self._dxf_job = DxfLoader(fn, key)       # keeps the signals alive
+        self._dxf_job.signals.done.connect(self._on_dxf_loaded)
+        self._dxf_job.signals.failed.connect(self._on_dxf_failed)
+        QThreadPool.globalInstance().start(self._dxf_job)
+        self._show_status(f"Loading {Path(fn).name}…")
+
+    def _on_dxf_failed(self, msg: str):
+        self._dxf_job = None
+        self._import_act.setEnabled(True)
+        self._show_status("")
+        QMessageBox.critical(self, "DXF Error", msg)
+
+    def _on_dxf_loaded(self, wrapper: Dxf):
+        job, self._dxf_job = self._dxf_job, None
+        if job is not None:
+            remember_dxf(job.key, wrapper)
+        self._import_act.setEnabled(True)
+        fn = wrapper.path
+        self.dxfWrapper = wrapper
         self.view.load_doc(self.dxfWrapper.doc)
 
         # ---------- add / refresh pinned DXF row ------------------------
@@ -261,41 +359,72 @@ class MainWindow(QMainWindow):
         info = DxfInfo(Path(fn).resolve(), xmin=xmin)
 
         # if a previous DXF row exists, replace it
-        if self.process_list.count() and isinstance(self.proc_mgr.passes[0], DxfInfo):
-            self.proc_mgr.update(0, info)
-            it = self.process_list.item(0); it.setData(Qt.UserRole, info)
+        if self.proc_mgr.passes and isinstance(self.proc_mgr.passes[0], DxfInfo):
+            self._proc_model.replace(0, info)
         else:
-            self.proc_mgr.insert(0, info)
-            self.process_list.insert_process_item(0, "DXF", info)
+            self._proc_model.insert(0, "DXF", info)
 
         self._dxf_info = info
-        self.process_list.setCurrentRow(0)
-        self.statusBar().showMessage(f"Loaded {Path(fn).name}", 4000)
+        # a Min X edit still pending belongs to the previous drawing; row 0
+        # may already be current, so the palette would not refresh itself
+        self._xmin_timer.stop()
+        self._xmin_spin.blockSignals(True)
+        self._xmin_spin.setValue(xmin)
+        self._xmin_spin.blockSignals(False)
+        self.process_list.set_current_row(0)
+        self._show_status(f"Loaded {Path(fn).name}", 4000)
 
 
     # ---------------------------------------------------------------- path helper
-    def _generate_path(self, label: str, *, row: int | None = None):
-        """Build and register a :class:`probe.Path` of type *label*."""
+    def _generate_path(self, label: str, *, old: probe.Path | None = None):
+        """Build a :class:`probe.Path` of type *label* on a pool thread.
 
-        try:
-            path = operations.generate_path(self.dxfWrapper, config, label)
-        except ValueError as e:
-            QMessageBox.warning(self, label.capitalize(), str(e))
-            return None
+        One job at a time: a regeneration asked for meanwhile runs once
+        the current job is done, with the settings as they are by then.
+        """
+        if self._path_job is not None:
+            if old is not None:
+                self._regen_pending = True
+            else:
+                self._show_status("Still generating the previous path…", 3000)
+            return
 
-        if row is None:
-            self.proc_mgr.add(path)
-            idx = self.proc_mgr.count_by_label(label)
-            self.process_list.add_process_item(f"{label.capitalize()} {idx}", path)
+        self._apply_dxf_shift()                  # no job running: safe to mutate
+        job = PathBuilder(self.dxfWrapper, copy.deepcopy(config), label, old)
+        job.signals.done.connect(self._on_path_ready)
+        job.signals.failed.connect(self._on_path_failed)
+        self._path_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _run_pending_regen(self):
+        if self._regen_pending:
+            self._regen_pending = False
+            self._regen_current_process()
+
+    def _on_path_failed(self, msg: str):
+        job, self._path_job = self._path_job, None
+        QMessageBox.warning(self, job.label.capitalize(), msg)
+        self._run_pending_regen()
+
+    def _on_path_ready(self, path: probe.Path):
+        job, self._path_job = self._path_job, None
+        label = job.label
+
+        if job.old is None:
+            idx = self.proc_mgr.count_by_label(label) + 1
+            self._proc_model.append(f"{label.capitalize()} {idx}", path)
         else:
-            self.proc_mgr.update(row, path)
-            item = self.process_list.item(row)
-            if item:
-                item.setData(Qt.UserRole, path)
+            # rows may have been moved or deleted meanwhile: find the pass itself
+            row = next((i for i, p in enumerate(self.proc_mgr.passes)
+                        if p is job.old), None)
+            if row is None:                       # deleted: drop the result
+                self._run_pending_regen()
+                return
+            self._proc_model.replace(row, path)
 
-        self.view.display_path(path.points)
-        self.statusBar().showMessage(f"{label.capitalize()} path generated", 3000)
-        return path
+        self.view.display_path_idle(path.points)
+        self._show_status(f"{label.capitalize()} path generated", 3000)
+        self._run_pending_regen()
 
 
     # ================================================================= Roughing
@@ -316,23 +445,20 @@ class MainWindow(QMainWindow):
 
 
     def _regen_current_process(self):
-        item = self.process_list.currentItem()
-        if not item or not getattr(self, "dxfWrapper", None):
+        row = self.process_list.current_row()
+        if row < 0 or not getattr(self, "dxfWrapper", None):
             return
-        row   = self.process_list.currentRow()
-        label = item.text().lower()
+        label = self.proc_mgr.label_at(row)
 
-        if label.startswith("roughing"):
-            self._generate_path("roughing", row=row)
-        elif label.startswith("smoothing"):
-            self._generate_path("smoothing", row=row)
+        if label in ("roughing", "smoothing"):
+            self._generate_path(label, old=self.proc_mgr[row])
 
 
     # ---------------------------------------------------------------- click handler
-    def _on_process_clicked(self, item: QListWidgetItem):
-        path = item.data(Qt.UserRole)
+    def _on_process_clicked(self, index):
+        path = index.data(Qt.UserRole)
         if isinstance(path, probe.Path):
-            self.view.display_path(path.points)
+            self.view.display_path_idle(path.points)
 
     def export_gcode(self, checked: bool = False):
         # 1) choose save location
@@ -359,12 +485,13 @@ class MainWindow(QMainWindow):
 
         # 3) build & save using utility function
         try:
-            out_path = operations.export_gcode(self.proc_mgr.passes, config, fn)
+            out_path = operations.export_gcode(self.proc_mgr.passes, config, fn,
+                                               labels=self.proc_mgr.labels)
         except ValueError as e:
             QMessageBox.warning(self, "Export G-code", str(e))
             return
 
-        self.statusBar().showMessage(f"G‑code saved → {out_path.name}", 4000)
+        self._show_status(f"G‑code saved → {out_path.name}", 4000)
 
     def simulate(self):
         # 1) ask for a .s10 if none is supplied
@@ -372,6 +499,9 @@ class MainWindow(QMainWindow):
         if not fn:
             return
 
+        # the viewer pulls in OpenGL, pyqtgraph and numba: load on first use
+        from simulator.viewer import GCodeSimDock
+
         # 2) close any previous simulator dock
         if self.sim_dock is not None:
             self.sim_dock.close()
@@ -379,6 +509,7 @@ class MainWindow(QMainWindow):
 
         # 3) create & dock the new one
         self.sim_dock = GCodeSimDock(fn, parent=self)
+        self.sim_dock.setObjectName("SimulatorDock")
         self.addDockWidget(Qt.RightDockWidgetArea, self.sim_dock)
         self.sim_dock.show()
 
@@ -413,31 +544,33 @@ class MainWindow(QMainWindow):
             self.orient_act.setToolTip("Table: front view")
 
     def _on_xmin_changed(self, new_val):
+        if self._dxf_info is not None:
+            self._xmin_timer.start()             # translate once, at the last value
+
+    def _apply_xmin(self):
         if self._dxf_info is None:
             return
 
+        new_val = self._xmin_spin.value()
         dx = new_val - self._dxf_info.xmin
         if abs(dx) < 1e-6:
             return
 
-        # ---- translate entities ---------------------------------------
-        self.dxfWrapper.translate_x(dx)
-
+        # ---- only the picture moves now; entities follow on demand -----
+        self._dxf_info.xshift += dx
         self._dxf_info.xmin = new_val
+        self.view.move_doc(dx)
 
-        # ---- redraw WITHOUT losing the table --------------------------
-        cfg      = config["machine_settings"]
-        length   = cfg["table_length"]
-        width    = cfg["table_width"]
-        orient   = cfg["table_orientation"]
-
-        self.view._table_item = None          # avoid dangling pointer
-        self.view._dot_items.clear()
-        self.view.scene().clear()
+    def _apply_dxf_shift(self):
+        """Move the ezdxf entities by the Min X shift already on screen.
 
-        # first redraw the table, then the DXF
-        self.view.draw_table(length, width, orientation=orient)
-        self.view.load_doc(self.dxfWrapper.doc)
+        Called before the drawing is sampled, so the entity walk runs
+        once per path instead of once per Min X edit.
+        """
+        info = self._dxf_info
+        if info is not None and abs(info.xshift) > 1e-9:
+            self.dxfWrapper.translate_x(info.xshift)
+            info.xshift = 0.0
 
 
 # ===================================================================== run
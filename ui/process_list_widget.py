@@ -1,54 +1,122 @@
 # ui/process_list_widget.py
-from typing import List
-
-from PyQt5.QtCore    import Qt, QSize
+from PyQt5.QtCore    import Qt, QAbstractListModel, QModelIndex
 from PyQt5.QtGui     import QFont
-from PyQt5.QtWidgets import (
-    QListWidget, QListWidgetItem, QAbstractItemView, QSizePolicy
-)
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+
+from ui.process_manager import DxfInfo
+
+
+class ProcessListModel(QAbstractListModel):
+    """The :class:`ProcessManager`'s passes as list rows (row 0 = DXF).
+
+    The manager's list is the only copy of the payloads; the model keeps
+    just the row names, given when a row is created.
+    """
+
+    def __init__(self, proc_mgr, parent=None):
+        super().__init__(parent)
+        self.mgr = proc_mgr
+        self._names: list[str] = []
+        self._bold = QFont(); self._bold.setBold(True)
+
+    # ---------- Qt model interface ------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._names[row]
+        if role == Qt.UserRole:
+            return self.mgr[row]
+        if role == Qt.FontRole and isinstance(self.mgr[row], DxfInfo):
+            return self._bold
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return (Qt.ItemIsEnabled | Qt.ItemIsSelectable
+                | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled)
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
 
+    def moveRows(self, src_parent, src, count, dst_parent, dest):
+        if not self.beginMoveRows(src_parent, src, src + count - 1, dst_parent, dest):
+            return False                            # no-op move
+        self.mgr.move(src, src + count - 1, dest)
+        names = self._names[src:src + count]
+        del self._names[src:src + count]
+        at = dest - count if dest > src else dest
+        self._names[at:at] = names
+        self.endMoveRows()
+        return True
 
-class ProcessListWidget(QListWidget):
+    # ---------- edits (manager and rows together) ---------------------
+    def append(self, name: str, obj) -> None:
+        self.insert(len(self._names), name, obj)
+
+    def insert(self, row: int, name: str, obj) -> None:
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.mgr.insert(row, obj)
+        self._names.insert(row, name)
+        self.endInsertRows()
+
+    def replace(self, row: int, obj) -> None:
+        self.mgr.update(row, obj)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+    def remove(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.mgr.remove(row)
+        del self._names[row]
+        self.endRemoveRows()
+
+
+class ProcessListView(QListView):
     """List that supports drag‑reorder, delete‑key removal, and a pinned row."""
 
     def __init__(self, proc_mgr, *args, **kw):
         super().__init__(*args, **kw)
-        self.proc_mgr = proc_mgr
+        self.setModel(ProcessListModel(proc_mgr, self))
 
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDefaultDropAction(Qt.MoveAction)
         self.setDragDropMode(QAbstractItemView.InternalMove)
 
-        self.setStyleSheet("QListWidget::item { height: 65px; }")
+        self.setStyleSheet("QListView::item { height: 65px; }")
 
-    # ---------- add helpers -------------------------------------------
-    def add_process_item(self, text: str, payload):
-        self._mk_item(self.count(), text, payload)
+    def current_row(self) -> int:
+        return self.currentIndex().row()
 
-    def insert_process_item(self, row: int, text: str, payload):
-        self._mk_item(row, text, payload, insert=True)
-
-    def _mk_item(self, row: int, text: str, payload, insert=False):
-        it = QListWidgetItem(text)
-        it.setData(Qt.UserRole, payload)
-        it.setSizeHint(QSize(it.sizeHint().width(), 65))
-        font = it.font(); font.setBold(text.lower() == "dxf"); it.setFont(font)
-        if insert:
-            self.insertItem(row, it)
-        else:
-            self.addItem(it)
+    def set_current_row(self, row: int) -> None:
+        self.setCurrentIndex(self.model().index(row))
 
     # ---------- drag‑drop ---------------------------------------------
     def dropEvent(self, event):
         tgt_row = self.indexAt(event.pos()).row()
-        if tgt_row == 0:          # keep DXF row pinned
-            return
-        src_row = self.currentRow()
-        if src_row == 0:
-            return
-        super().dropEvent(event)
-        self._sync()
+        src_row = self.current_row()
+        if tgt_row == 0 or src_row <= 0:   # keep DXF row pinned
+            event.ignore()
+        else:
+            pos = self.dropIndicatorPosition()
+            if tgt_row < 0 or pos == QAbstractItemView.OnViewport:
+                dest = self.model().rowCount()
+            else:
+                dest = tgt_row + (pos == QAbstractItemView.BelowItem)
+            self.model().moveRows(QModelIndex(), src_row, 1, QModelIndex(), dest)
+            # moved here already: CopyAction keeps the drag from removing the source
+            event.setDropAction(Qt.CopyAction)
+            event.accept()
+        # what QAbstractItemView.dropEvent would tidy up after a drop
+        self.stopAutoScroll()
+        self.setState(QAbstractItemView.NoState)
+        self.viewport().update()
 
     # ---------- delete‑key --------------------------------------------
     def keyPressEvent(self, ev):
@@ -56,13 +124,7 @@ class ProcessListWidget(QListWidget):
             rows = sorted({i.row() for i in self.selectedIndexes()}, reverse=True)
             if 0 in rows: rows.remove(0)     # don't delete DXF row
             for r in rows:
-                self.takeItem(r)
-                self.proc_mgr.remove(r)
+                self.model().remove(r)
             self.clearSelection()
         else:
             super().keyPressEvent(ev)
-
-    # ---------- helpers -----------------------------------------------
-    def _sync(self):
-        for i in range(self.count()):
-            self.proc_mgr.update(i, self.item(i).data(Qt.UserRole))
@@ -1,4 +1,5 @@
 # ui/process_manager.py
+from collections import Counter
 from typing import List
 from core.probe import Path
 from dataclasses import dataclass
@@ -7,37 +8,73 @@ from dataclasses import dataclass
 class DxfInfo:
     path: Path
     xmin: float 
+    xshift: float = 0.0      # Min X moves not yet applied to the entities
 
 class ProcessManager:
     
     def __init__(self) -> None:
         self._passes: List[object] = []      # Path or DxfInfo
+        self._labels: List[str] = []         # per pass: Path.label, "" for DxfInfo
+        self._label_counts: Counter = Counter()   # Path.label -> how many
 
     # ---------- storage -------------------------------------------------
     def add(self, obj) -> None:
         self._passes.append(obj)
+        self._labels.append(self._label(obj))
+        self._count(obj, 1)
 
     def insert(self, index: int, obj) -> None:        # ← ADD THIS
         """Insert *obj* at *index* (used for the pinned DXF row)."""
         self._passes.insert(index, obj)
+        self._labels.insert(index, self._label(obj))
+        self._count(obj, 1)
 
     def update(self, index: int, obj) -> None:
         """Replace the object at ``index`` with ``obj``."""
+        self._count(self._passes[index], -1)
         self._passes[index] = obj
+        self._labels[index] = self._label(obj)
+        self._count(obj, 1)
 
     def remove(self, index: int) -> None:
         """Remove the object at ``index``."""
-        self._passes.pop(index)
+        self._labels.pop(index)
+        self._count(self._passes.pop(index), -1)
+
+    def move(self, start: int, end: int, dest: int) -> None:
+        """Move ``start..end`` (inclusive) before *dest*, as Qt's rowsMoved
+        reports it (*dest* counted before the rows are taken out)."""
+        if dest > end:
+            dest -= end + 1 - start
+        for seq in (self._passes, self._labels):
+            moved = seq[start:end + 1]
+            del seq[start:end + 1]
+            seq[dest:dest] = moved
 
     def __getitem__(self, idx: int):
         return self._passes[idx]
 
     # ---------- helpers -------------------------------------------------
+    @staticmethod
+    def _label(obj) -> str:
+        return obj.label if isinstance(obj, Path) else ""
+
+    def _count(self, obj, delta: int) -> None:
+        if isinstance(obj, Path):
+            self._label_counts[obj.label] += delta
+
+    def label_at(self, idx: int) -> str:
+        """Path label of pass *idx*; ``""`` for the DXF row."""
+        return self._labels[idx]
+
     def count_by_label(self, label: str) -> int:
-        from core.probe import Path
-        return sum(1 for p in self._passes if isinstance(p, Path) and p.label == label)
+        return self._label_counts[label]
 
     @property
     def passes(self) -> List[object]:
         return self._passes
-    
\ No newline at end of file
+
+    @property
+    def labels(self) -> List[str]:
+        """Parallel to :attr:`passes`: each pass's label, ``""`` if none."""
+        return self._labels